@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import logging
 import signal
 import time
 
@@ -9,7 +10,7 @@ from src.hardware.pico.pico_mode_display import PicoModeDisplay
 
 from src.logic.input_controller import InputController
 from src.logic.input_manager import InputManager
-from src.logic.input_event import EventType
+from src.logic.input_event import EventType, release_events
 
 from src.logic.modes.menu_mode import MenuMode
 from src.logic.modes.piano_mode import PianoMode
@@ -19,6 +20,9 @@ from src.logic.modes.midi_song_mode import MidiSongMode
 
 def main() -> None:
     """Main entry point for the Pi-ano application."""
+    # Loggers are level-gated, so debug chatter costs nothing unless enabled here.
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     # ------------------------------------------------------------------
     # Hardware / engines
     # ------------------------------------------------------------------
@@ -92,8 +96,18 @@ def main() -> None:
             if any(e.type == EventType.SHUTDOWN for e in events):
                 raise KeyboardInterrupt()
 
-            input_manager.handle_events(events, now)
-            input_manager.update(now)
+            # Every Pico command of this frame (e.g. show_mode on a mode
+            # switch in handle_events, plus anything update() sends) goes
+            # out as one serial write.
+            pico_display.begin_batch()
+            try:
+                input_manager.handle_events(events, now)
+                input_manager.update(now)
+            finally:
+                pico_display.end_batch()
+
+            # Frame done: hand the events back to the pool for reuse.
+            release_events(events)
 
             if current_mode == "song":
                 time.sleep(0.001)
@@ -108,7 +122,7 @@ def main() -> None:
         # Best-effort cleanup order:
         # 1) Ask Pico to clear its LEDs BEFORE closing serial.
         # 2) Clear local LEDs.
-        # 3) Close audio.
+        # 3) Stop song prefetching, close audio.
         # 4) Close Pico serial.
         # ------------------------------------------------------------------
 
@@ -127,7 +141,12 @@ def main() -> None:
         except Exception:
             pass
 
-        # 3) Stop/close audio engine
+        # 3) Stop song-mode background parsing, then stop/close audio engine
+        try:
+            song.close()
+        except Exception:
+            pass
+
         try:
             audio.close()
         except Exception:
@@ -168,6 +187,10 @@ def print_startup_help() -> None:
     print("Press Ctrl+C in the terminal to quit.\n")
 
 
+# Button events still handled in piano mode (IR plays the notes there)
+_PIANO_BUTTON_EVENTS = (EventType.NEXT_MODE, EventType.MODE_SWITCH, EventType.NEXT_SF2, EventType.SHUTDOWN)
+
+
 def poll_all_inputs(input_controller: InputController, current_mode: str):
     """
     Poll all input sources and return a flat list of InputEvent objects.
@@ -191,13 +214,16 @@ def poll_all_inputs(input_controller: InputController, current_mode: str):
         btn_events = input_controller.buttons.poll()
 
         if current_mode == "piano":
-            btn_events = [
-                e
-                for e in btn_events
-                if e.type in (EventType.NEXT_MODE, EventType.MODE_SWITCH, EventType.NEXT_SF2, EventType.SHUTDOWN)
-            ]
-
-        events.extend(btn_events)
+            # Dropped NOTE events go straight back to the pool
+            dropped = []
+            for e in btn_events:
+                if e.type in _PIANO_BUTTON_EVENTS:
+                    events.append(e)
+                else:
+                    dropped.append(e)
+            release_events(dropped)
+        else:
+            events.extend(btn_events)
 
     # IR: only used in piano mode
     if current_mode == "piano" and input_controller.ir is not None:
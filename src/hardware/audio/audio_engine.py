@@ -216,6 +216,66 @@ class AudioEngine:
         """
         self.fs.noteoff(self.piano_channel, midi_note)
 
+    def notes_on_midi_raw(self, notes) -> None:
+        """
+        Trigger note on for a batch of (midi_note, midi_velocity) pairs.
+        midi_velocity is a MIDI byte (1~127), passed to the synth unchanged.
+        """
+        noteon = self.fs.noteon
+        channel = self.piano_channel
+        for midi_note, midi_velocity in notes:
+            noteon(channel, midi_note, midi_velocity)
+
+    def notes_off_midi(self, midi_notes) -> None:
+        """
+        Trigger note off for a batch of MIDI note numbers.
+        """
+        noteoff = self.fs.noteoff
+        channel = self.piano_channel
+        for midi_note in midi_notes:
+            noteoff(channel, midi_note)
+
+
+    # ------------------------------------------------------------------
+    # Sequencer API (for RhythmMode's AudioScheduler)
+    # ------------------------------------------------------------------
+    def create_sequencer(self):
+        """
+        Create a FluidSynth sequencer bound to this synth (1 tick = 1 ms,
+        clocked by the synth's audio rendering), so notes can be queued
+        ahead of time and played from the audio thread.
+
+        Returns (sequencer, destination id), or None if this pyfluidsynth
+        build has no Sequencer support.
+        """
+        seq_cls = getattr(fluidsynth, "Sequencer", None)
+        if seq_cls is None:
+            return None
+        try:
+            seq = seq_cls(time_scale=1000, use_system_timer=False)
+            dest = seq.register_fluidsynth(self.fs)
+        except Exception as e:
+            print("[AudioEngine] Sequencer unavailable:", e)
+            return None
+        return seq, dest
+
+    def schedule_note_on_midi(
+        self, seq, dest: int, tick: int, midi_note: int, midi_velocity: int
+    ) -> None:
+        """
+        Queue a note on on a sequencer from create_sequencer(), at absolute
+        sequencer time `tick`. midi_velocity is a MIDI byte (1~127), passed
+        to the synth unchanged.
+        """
+        seq.note_on(
+            tick,
+            absolute=True,
+            channel=self.piano_channel,
+            key=midi_note,
+            velocity=midi_velocity,
+            dest=dest,
+        )
+
 
     # ------------------------------------------------------------------
     # Hit SFX
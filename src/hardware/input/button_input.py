@@ -5,7 +5,7 @@ from typing import List
 import board
 import digitalio
 
-from src.logic.input_event import InputEvent, EventType
+from src.logic.input_event import InputEvent, EventType, acquire_event
 from src.hardware.config.keys import KeyId
 from src.logic.input_config import LONG_PRESS
 
@@ -114,8 +114,8 @@ class ButtonInput:
 
                 # Immediately emit NOTE_ON (used as "hit" in rhythm mode)
                 events.append(
-                    InputEvent(
-                        type=EventType.NOTE_ON,
+                    acquire_event(
+                        event_type=EventType.NOTE_ON,
                         key=ch.key,
                         velocity=1.0,
                         source="button",
@@ -149,8 +149,8 @@ class ButtonInput:
 
                     if ev_type is not None:
                         events.append(
-                            InputEvent(
-                                type=ev_type,
+                            acquire_event(
+                                event_type=ev_type,
                                 source="button",
                             )
                         )
@@ -163,8 +163,8 @@ class ButtonInput:
             if (not ch.last_value) and current:
                 # Emit NOTE_OFF on release
                 events.append(
-                    InputEvent(
-                        type=EventType.NOTE_OFF,
+                    acquire_event(
+                        event_type=EventType.NOTE_OFF,
                         key=ch.key,
                         velocity=1.0,
                         source="button",
@@ -9,7 +9,7 @@ import busio
 import digitalio
 import adafruit_vl53l0x
 
-from src.logic.input_event import InputEvent, EventType
+from src.logic.input_event import InputEvent, EventType, acquire_event
 from src.hardware.config.keys import KeyId
 
 
@@ -246,8 +246,8 @@ class IRInput:
                 if debounced_present:
                     velocity = self.default_velocity
                     events.append(
-                        InputEvent(
-                            type=EventType.NOTE_ON,
+                        acquire_event(
+                            event_type=EventType.NOTE_ON,
                             key=ch.key,
                             velocity=velocity,
                             source="ir",
@@ -259,8 +259,8 @@ class IRInput:
                         )
                 else:
                     events.append(
-                        InputEvent(
-                            type=EventType.NOTE_OFF,
+                        acquire_event(
+                            event_type=EventType.NOTE_OFF,
                             key=ch.key,
                             source="ir",
                         )
@@ -5,7 +5,7 @@ import select
 from typing import List
 
 from src.hardware.config.keys import KeyId
-from src.logic.input_event import InputEvent, EventType
+from src.logic.input_event import InputEvent, EventType, acquire_event
 
 
 class KeyboardInput:
@@ -60,8 +60,8 @@ class KeyboardInput:
             mode_name = parts[1].lower()
             if mode_name in ("menu", "piano", "rhythm", "song"):
                 events.append(
-                    InputEvent(
-                        type=EventType.MODE_SWITCH,
+                    acquire_event(
+                        event_type=EventType.MODE_SWITCH,
                         mode_name=mode_name,
                         source="keyboard",
                     )
@@ -77,8 +77,8 @@ class KeyboardInput:
         # Handle next song (only meaningful in song mode)
         if cmd == "next":
             events.append(
-                InputEvent(
-                    type=EventType.NEXT_SONG,
+                acquire_event(
+                    event_type=EventType.NEXT_SONG,
                     source="keyboard",
                 )
             )
@@ -102,8 +102,8 @@ class KeyboardInput:
                     print("Invalid velocity, using 1.0")
 
             events.append(
-                InputEvent(
-                    type=EventType.NOTE_ON,
+                acquire_event(
+                    event_type=EventType.NOTE_ON,
                     key=key,
                     velocity=velocity,
                     source="keyboard",
@@ -122,8 +122,8 @@ class KeyboardInput:
                 return events
 
             events.append(
-                InputEvent(
-                    type=EventType.NOTE_OFF,
+                acquire_event(
+                    event_type=EventType.NOTE_OFF,
                     key=key,
                     source="keyboard",
                 )
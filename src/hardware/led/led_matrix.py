@@ -11,7 +11,7 @@ Key IDs and their zones are defined in hardware.config.keys.
 """
 
 import time
-from typing import Tuple
+from typing import Dict, Tuple
 
 import board
 import neopixel
@@ -64,6 +64,32 @@ class LedMatrix:
         # current key color palette (default = KEY_COLORS)
         self.key_colors = dict(KEY_COLORS)
 
+        # Strip indices covered by each key zone (all rows), so key fills are
+        # a flat write loop instead of per-pixel mapping + bounds checks.
+        self._key_indices: Dict[KeyId, Tuple[int, ...]] = {
+            key_id: tuple(
+                self._xy_to_index(x, y)
+                for x in range(x_start, x_end + 1)
+                for y in range(self.height)
+            )
+            for key_id, (x_start, x_end) in KEY_ZONES.items()
+        }
+
+        # Strip order as row-major frame indices: _strip_order[i] is the
+        # (y * width + x) slot that strip pixel i shows. Lets blit() push a
+        # whole frame with one slice write instead of per-pixel set_xy.
+        strip_order = [0] * (self.width * self.height)
+        for y in range(self.height):
+            for x in range(self.width):
+                strip_order[self._xy_to_index(x, y)] = y * self.width + x
+        self._strip_order: Tuple[int, ...] = tuple(strip_order)
+
+        # Strip indices of each column, y = 0..height-1 (for set_column)
+        self._column_indices: Tuple[Tuple[int, ...], ...] = tuple(
+            tuple(self._xy_to_index(x, y) for y in range(self.height))
+            for x in range(self.width)
+        )
+
     # ---------------- LOW-LEVEL mapping ----------------
 
     def _validate_xy(self, x: int, y: int) -> None:
@@ -103,6 +129,23 @@ class LedMatrix:
         idx = self._xy_to_index(x, y)
         self._pixels[idx] = color
 
+    def blit(self, frame) -> None:
+        """
+        Write a full frame in one pass.
+        frame is a row-major sequence of width*height RGB tuples,
+        frame[y * width + x] being the color for (x, y).
+        """
+        self._pixels[:] = [frame[i] for i in self._strip_order]
+
+    def set_column(self, x: int, colors) -> None:
+        """
+        Set a whole column at once: colors[y] is the color for (x, y).
+        """
+        self._validate_xy(x, 0)
+        pixels = self._pixels
+        for idx, color in zip(self._column_indices[x], colors):
+            pixels[idx] = color
+
     def clear_all(self) -> None:
         """
         Set all pixels to black (off).
@@ -176,19 +219,28 @@ class LedMatrix:
         if color is None:
             color = self.key_colors.get(key_id, (255, 255, 255))
 
-        x_start, x_end = KEY_ZONES[key_id]
-
         brightness = max(0.0, min(1.0, brightness))
         r, g, b = color
-        r = int(r * brightness)
-        g = int(g * brightness)
-        b = int(b * brightness)
+        rgb = (int(r * brightness), int(g * brightness), int(b * brightness))
 
-        for x in range(x_start, x_end + 1):
-            for y in range(self.height):
-                self.set_xy(x, y, (r, g, b))
+        pixels = self._pixels
+        for idx in self._key_indices[key_id]:
+            pixels[idx] = rgb
 
 
+    def fill_keys(self, keys, colors) -> None:
+        """
+        Fill several piano key blocks in one pass.
+        colors[i] is written as-is (no brightness scaling) to keys[i].
+        """
+        pixels = self._pixels
+        for key, color in zip(keys, colors):
+            indices = self._key_indices.get(self._normalize_key(key))
+            if indices is None:
+                continue
+            for idx in indices:
+                pixels[idx] = color
+
     def clear_key(self, key) -> None:
         """
         Clear a piano key block (set all pixels in that zone to black).
@@ -197,10 +249,9 @@ class LedMatrix:
         if key_id is None or key_id not in KEY_ZONES:
             return
 
-        x_start, x_end = KEY_ZONES[key_id]
-        for x in range(x_start, x_end + 1):
-            for y in range(self.height):
-                self.set_xy(x, y, (0, 0, 0))
+        pixels = self._pixels
+        for idx in self._key_indices[key_id]:
+            pixels[idx] = (0, 0, 0)
 
     # ---------------- HIGH-LEVEL: demos ----------------
 
@@ -1,6 +1,7 @@
 # pico_mode_display.py
 from __future__ import annotations
 
+import logging
 import time
 from typing import List, Optional
 
@@ -10,6 +11,9 @@ except ImportError:
     serial = None
 
 
+_log = logging.getLogger("pi_ano.pico")
+
+
 class PicoModeDisplay:
     """
     Small helper for talking to the Pico over USB serial.
@@ -53,10 +57,14 @@ class PicoModeDisplay:
         self.baudrate = baudrate
         self.enabled = enabled and (serial is not None)
         self.ser: Optional[serial.Serial] = None
-        self._rx_buffer: str = ""
+        self._rx_buffer: bytes = b""
+        # Lines queued between begin_batch() and end_batch(); None = write immediately.
+        self._tx_queue: Optional[List[str]] = None
+        # begin_batch() nesting depth; the queue is flushed by the outermost end_batch()
+        self._tx_depth: int = 0
 
         if not self.enabled:
-            print("[PicoModeDisplay] disabled (no serial module or disabled flag)")
+            _log.info("[PicoModeDisplay] disabled (no serial module or disabled flag)")
             return
 
         try:
@@ -72,10 +80,10 @@ class PicoModeDisplay:
 
             self.ser.reset_input_buffer()
             self.ser.reset_output_buffer()
-            print(f"[PicoModeDisplay] opened {device} @ {baudrate}")
+            _log.info("[PicoModeDisplay] opened %s @ %s", device, baudrate)
 
         except Exception as e:
-            print(f"[PicoModeDisplay] FAILED to open {device}: {e}")
+            _log.error("[PicoModeDisplay] FAILED to open %s: %s", device, e)
             self.ser = None
             self.enabled = False
 
@@ -93,17 +101,48 @@ class PicoModeDisplay:
             self.ser = None
 
     def _send_line(self, line: str) -> None:
-        """Send one newline-terminated command line to Pico."""
+        """Send one newline-terminated command line to Pico (or queue it if batching)."""
+        if self._tx_queue is not None:
+            self._tx_queue.append(line)
+            return
+        self.send_batch((line,))
+
+    def send_batch(self, lines) -> None:
+        """Send several command lines to Pico with a single serial write."""
         if not self.enabled or self.ser is None:
             return
         try:
-            text = line.strip()
-            data = (text + "\n").encode("utf-8")
+            texts = [line.strip() for line in lines]
+            if not texts:
+                return
+            data = "".join(text + "\n" for text in texts).encode("utf-8")
             self.ser.write(data)
             self.ser.flush()
-            print(f"[Pico >>] {text}")
+            # Per-line traffic trace: debug only, skipped entirely otherwise
+            if _log.isEnabledFor(logging.DEBUG):
+                for text in texts:
+                    _log.debug("[Pico >>] %s", text)
         except Exception as e:
-            print("[PicoModeDisplay] write error:", e)
+            _log.error("[PicoModeDisplay] write error: %s", e)
+
+    def begin_batch(self) -> None:
+        """
+        Queue subsequent commands until end_batch() instead of writing each one.
+        Batches may nest: only the outermost end_batch() writes.
+        """
+        self._tx_depth += 1
+        if self._tx_queue is None:
+            self._tx_queue = []
+
+    def end_batch(self) -> None:
+        """Flush all commands queued since the outermost begin_batch() in one write."""
+        if self._tx_depth > 1:
+            self._tx_depth -= 1
+            return
+        self._tx_depth = 0
+        lines, self._tx_queue = self._tx_queue, None
+        if lines:
+            self.send_batch(lines)
 
     # ------------------------------------------------------------------
     # Public API used by InputManager / main.py
@@ -150,23 +189,25 @@ class PicoModeDisplay:
             if n <= 0:
                 return []
 
-            data = self.ser.read(n).decode("utf-8", errors="ignore")
+            # One read drains everything the UART has buffered.
+            data = self.ser.read(n)
             if not data:
                 return []
 
-            self._rx_buffer += data
+            # Split everything received so far in one pass; the last piece is
+            # an incomplete line (or b"") carried over to the next poll. Only
+            # complete lines are decoded.
+            *lines, self._rx_buffer = (self._rx_buffer + data).split(b"\n")
 
-            # Extract complete lines from the buffer.
-            while "\n" in self._rx_buffer:
-                line, self._rx_buffer = self._rx_buffer.split("\n", 1)
-                line = line.strip()
+            for raw in lines:
+                line = raw.decode("utf-8", errors="ignore").strip()
                 if not line:
                     continue
-                print(f"[Pico <<] {line}")
+                _log.debug("[Pico <<] %s", line)
                 msgs.append(line)
 
         except Exception as e:
-            print("[PicoModeDisplay] read error:", e)
+            _log.error("[PicoModeDisplay] read error: %s", e)
 
         return msgs
 
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import Optional
+from typing import Iterable, List, Optional
 
 from src.hardware.config.keys import KeyId
 
@@ -14,7 +14,7 @@ class EventType(Enum):
     NEXT_SF2 = auto()      # button: long press D25 (KEY_1) → switch SoundFont
     SHUTDOWN = auto()      # button: long press KEY_0 to quit
 
-@dataclass
+@dataclass(slots=True)
 class InputEvent:
     type: EventType
 
@@ -27,3 +27,46 @@ class InputEvent:
 
     # Source tag ("keyboard" / "button" / "ir"...), optional
     source: Optional[str] = None
+
+
+# ---------------------------------------------------------------------------
+# Event pool: input devices acquire events here and the main loop hands them
+# back once the frame is processed, so steady polling doesn't churn the allocator.
+# ---------------------------------------------------------------------------
+
+_EVENT_POOL: List[InputEvent] = []
+_EVENT_POOL_MAX = 64
+
+
+def acquire_event(
+    event_type: EventType,
+    key: Optional[KeyId] = None,
+    velocity: float = 1.0,
+    mode_name: Optional[str] = None,
+    source: Optional[str] = None,
+) -> InputEvent:
+    """
+    Return a recycled InputEvent (or a new one if the pool is empty)
+    initialized with the given fields.
+    """
+    if not _EVENT_POOL:
+        return InputEvent(type=event_type, key=key, velocity=velocity, mode_name=mode_name, source=source)
+
+    ev = _EVENT_POOL.pop()
+    ev.type = event_type
+    ev.key = key
+    ev.velocity = velocity
+    ev.mode_name = mode_name
+    ev.source = source
+    return ev
+
+
+def release_events(events: Iterable[InputEvent]) -> None:
+    """
+    Return processed events to the pool.
+    Callers must not keep references to them afterwards.
+    """
+    for ev in events:
+        if len(_EVENT_POOL) >= _EVENT_POOL_MAX:
+            return
+        _EVENT_POOL.append(ev)
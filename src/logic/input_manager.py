@@ -2,15 +2,72 @@
 
 from __future__ import annotations
 
-from typing import List, Optional
+import logging
+from enum import IntEnum
+from typing import Callable, Dict, List, Optional
 
 from src.logic.input_event import InputEvent, EventType
 from src.hardware.config.keys import KeyId
 from src.hardware.pico.pico_mode_display import PicoModeDisplay
 from src.logic.high_scores import HighScoreStore
+from src.logic.modes.rhythm_mode import PHASE_DONE, PHASE_PLAY, PHASE_WAIT_COUNTDOWN
 
 
+_log = logging.getLogger("pi_ano.input")
+
+
+class Mode(IntEnum):
+    # Declaration order is also the long-press NEXT_MODE cycle order.
+    MENU = 0
+    PIANO = 1
+    RHYTHM = 2
+    SONG = 3
+
+
+# Lower-case names used by the Pico protocol and the main loop, indexed by Mode.
+_MODE_NAMES: tuple[str, ...] = tuple(m.name.lower() for m in Mode)
+_MODE_BY_NAME: Dict[str, Mode] = {name: Mode(i) for i, name in enumerate(_MODE_NAMES)}
+
+_NOTE_TYPES = frozenset({EventType.NOTE_ON, EventType.NOTE_OFF})
+_BUTTON = "button"
+
 class InputManager:
+    # One long-lived instance whose attributes are read every frame:
+    # fixed slots instead of a per-instance __dict__.
+    __slots__ = (
+        "menu",
+        "piano",
+        "rhythm",
+        "song",
+        "pico_display",
+        "current_mode",
+        "_high_scores",
+        "_rhythm_postgame_started",
+        "_rhythm_postgame_stage",
+        "_rhythm_postgame_stage_idx",
+        "_postgame_stages",
+        "_rhythm_postgame_t0",
+        "_rhythm_last_score",
+        "_rhythm_last_best",
+        "_rhythm_last_max_score",
+        "_rhythm_last_difficulty",
+        "_rhythm_postgame_eligible",
+        "_pico_best_score_done",
+        "_pi_colors_during_title_sec",
+        "_filtered_buf",
+        "_pico_handlers",
+        "_pico_rhythm_handlers",
+        "_global_handlers",
+        "_menu_update",
+        "_menu_handle",
+        "_piano_update",
+        "_piano_handle",
+        "_rhythm_update",
+        "_rhythm_handle",
+        "_song_update",
+        "_song_handle",
+    )
+
     def __init__(
         self,
         menu,
@@ -26,22 +83,35 @@ class InputManager:
 
         self.pico_display = pico_display
 
-        self.current_mode: str = "menu"
-        self._mode_order = ["menu", "piano", "rhythm", "song"]
+        # Per-frame mode entry points, resolved once (None if a mode lacks one)
+        self._menu_update = getattr(menu, "update", None)
+        self._menu_handle = getattr(menu, "handle_events", None)
+        self._piano_update = getattr(piano, "update", None)
+        self._piano_handle = getattr(piano, "handle_events", None)
+        self._rhythm_update = getattr(rhythm, "update", None)
+        self._rhythm_handle = getattr(rhythm, "handle_events", None)
+        self._song_update = getattr(song, "update", None)
+        self._song_handle = getattr(song, "handle_events", None)
+
+        self.current_mode: Mode = Mode.MENU
 
         # Rhythm high scores and post-game timeline state
         self._high_scores = HighScoreStore()
         self._rhythm_postgame_started: bool = False
         self._rhythm_postgame_stage: Optional[str] = None
-        # stages:
-        #   "result_scroll" → "user_label" → "user_score" → "best_label"
-        #   → "best_score_wait_done" → "pi_colors_during_title"
+        # Index into _postgame_stages of the current stage
+        self._rhythm_postgame_stage_idx: int = 0
         self._rhythm_postgame_t0: float = 0.0
         self._rhythm_last_score: int = 0
         self._rhythm_last_best: int = 0
         self._rhythm_last_max_score: int = 0
         self._rhythm_last_difficulty: str = "easy"
 
+        # Set by RhythmMode.on_done when a run finishes; the post-game timeline
+        # only runs while this is armed.
+        self._rhythm_postgame_eligible: bool = False
+        self.rhythm.on_done = self._on_rhythm_done
+
         # Pico → Pi handshake:
         self._pico_best_score_done: bool = False
 
@@ -49,9 +119,43 @@ class InputManager:
         # Match Pico's RHYTHM_TITLE_HOLD_SEC (you showed it's 3.0s)
         self._pi_colors_during_title_sec: float = 3.0
 
+        # Post-game timeline: (stage name, duration, action run when it ends).
+        # A None duration means "wait for Pico's BEST_SCORE_DONE handshake".
+        self._postgame_stages: tuple[tuple[str, Optional[float], Callable[[float], None]], ...] = (
+            ("result_scroll", 4.0, self._postgame_send_user_label),
+            ("user_label", 3.0, self._postgame_send_user_score),
+            ("user_score", 3.0, self._postgame_send_best_label),
+            # You set this short; OK as long as Pico doesn't queue BEST_SCORE behind marquee.
+            ("best_label", 1.0, self._postgame_send_best_score),
+            # Key sync point: only when Pico tells us BEST score display finished
+            ("best_score_wait_done", None, self._postgame_back_to_title),
+            # Pi shows difficulty colors for as long as Pico shows RYTHM.bmp
+            ("pi_colors_during_title", self._pi_colors_during_title_sec, self._postgame_finish),
+        )
+
+        # Reused every frame for the piano-mode event filter (cleared in place).
+        self._filtered_buf: List[InputEvent] = []
+
+        # Mode-independent event actions, dispatched by event type.
+        self._global_handlers: Dict[EventType, Callable[[InputEvent, float], None]] = {
+            EventType.NEXT_SF2: self._on_next_sf2,
+            EventType.MODE_SWITCH: self._on_mode_switch,
+            EventType.NEXT_MODE: self._on_next_mode,
+            EventType.NOTE_ON: self._on_note_on,
+        }
+
+        # Pico → Pi message dispatch: prefix first, then the rhythm sub-command.
+        self._pico_handlers: Dict[str, Callable[[str, float], None]] = {
+            "RHYTHM": self._on_pico_rhythm_message,
+        }
+        self._pico_rhythm_handlers: Dict[str, Callable[[float], None]] = {
+            "COUNTDOWN_DONE": self._on_pico_countdown_done,
+            "BEST_SCORE_DONE": self._on_pico_best_score_done,
+        }
+
     @property
     def current_mode_name(self) -> str:
-        return self.current_mode
+        return _MODE_NAMES[self.current_mode]
 
     def _get_audio_engine(self):
         for mode in (self.piano, self.rhythm, self.song):
@@ -60,6 +164,9 @@ class InputManager:
                 return audio
         return None
 
+    def _on_rhythm_done(self) -> None:
+        self._rhythm_postgame_eligible = True
+
     def _rhythm_is_in_postgame(self) -> bool:
         return bool(self._rhythm_postgame_started and self._rhythm_postgame_stage is not None)
 
@@ -70,7 +177,7 @@ class InputManager:
                 self.rhythm.show_mode_colors()
                 return
             except Exception as e:
-                print("[InputManager] rhythm.show_mode_colors error:", e)
+                _log.error("[InputManager] rhythm.show_mode_colors error: %s", e)
 
         # Fallback: reuse existing renderer
         if hasattr(self.rhythm, "_render_wait_countdown"):
@@ -78,142 +185,149 @@ class InputManager:
                 self.rhythm._render_wait_countdown()
                 return
             except Exception as e:
-                print("[InputManager] rhythm._render_wait_countdown error:", e)
+                _log.error("[InputManager] rhythm._render_wait_countdown error: %s", e)
 
     def _cycle_mode(self, now: float) -> None:
-        if self.current_mode not in self._mode_order:
-            next_mode = "menu"
-        else:
-            idx = self._mode_order.index(self.current_mode)
-            next_mode = self._mode_order[(idx + 1) % len(self._mode_order)]
-        self._switch_mode(next_mode, now)
-
-    def _switch_mode(self, mode_name: str, now: float) -> None:
-        if mode_name == self.current_mode:
+        self._switch_mode(Mode((self.current_mode + 1) % len(Mode)), now)
+
+    def _switch_mode(self, mode: Mode, now: float) -> None:
+        if mode == self.current_mode:
             return
 
-        if self.current_mode == "rhythm":
+        if self.current_mode == Mode.RHYTHM:
             if hasattr(self.rhythm, "on_exit"):
                 self.rhythm.on_exit()
             self._rhythm_postgame_started = False
             self._rhythm_postgame_stage = None
+            self._rhythm_postgame_eligible = False
             self._pico_best_score_done = False
 
-        self.current_mode = mode_name
-        print(f"[MODE] Switched to: {self.current_mode.upper()}")
+        self.current_mode = mode
+        _log.info("[MODE] Switched to: %s", mode.name)
 
-        if mode_name == "menu":
+        if mode == Mode.MENU:
             if hasattr(self.menu, "reset"):
                 self.menu.reset(now)
 
-        elif mode_name == "piano":
+        elif mode == Mode.PIANO:
             if hasattr(self.piano, "randomize_palette"):
                 self.piano.randomize_palette()
             if hasattr(self.piano, "reset"):
                 self.piano.reset(now)
 
-        elif mode_name == "rhythm":
+        elif mode == Mode.RHYTHM:
             self._rhythm_postgame_started = False
             self._rhythm_postgame_stage = None
+            self._rhythm_postgame_eligible = False
             self._pico_best_score_done = False
             self.rhythm.reset(now)
 
-        elif mode_name == "song":
+        elif mode == Mode.SONG:
             self.song.reset(now)
 
         if self.pico_display is not None:
             try:
-                self.pico_display.show_mode(mode_name)
+                self.pico_display.show_mode(_MODE_NAMES[mode])
             except Exception as e:
-                print("[InputManager] pico_display.show_mode error:", e)
+                _log.error("[InputManager] pico_display.show_mode error: %s", e)
 
     def _handle_pico_message(self, msg: str, now: float) -> None:
         if not msg:
             return
-        text = msg.strip()
-        if not text:
-            return
 
-        up = text.upper()
+        # Pico messages are "<PREFIX>:<rest>"; dispatch on the prefix.
+        head, _, rest = msg.strip().partition(":")
+        handler = self._pico_handlers.get(head)
+        if handler is not None:
+            handler(rest, now)
 
-        if up.startswith("RHYTHM:COUNTDOWN_DONE"):
-            if self.current_mode == "rhythm":
-                print("[InputManager] Pico → RHYTHM:COUNTDOWN_DONE")
-                try:
-                    self.rhythm.start_play_after_countdown(now)
-                except Exception as e:
-                    print("[InputManager] rhythm.start_play_after_countdown error:", e)
-            return
-
-        if up.startswith("RHYTHM:BEST_SCORE_DONE"):
-            if self.current_mode == "rhythm":
-                print("[InputManager] Pico → RHYTHM:BEST_SCORE_DONE")
-                self._pico_best_score_done = True
+    def _on_pico_rhythm_message(self, rest: str, now: float) -> None:
+        if self.current_mode != Mode.RHYTHM:
             return
+        handler = self._pico_rhythm_handlers.get(rest)
+        if handler is not None:
+            handler(now)
+
+    def _on_pico_countdown_done(self, now: float) -> None:
+        _log.debug("[InputManager] Pico → RHYTHM:COUNTDOWN_DONE")
+        try:
+            self.rhythm.start_play_after_countdown(now)
+        except Exception as e:
+            _log.error("[InputManager] rhythm.start_play_after_countdown error: %s", e)
+
+    def _on_pico_best_score_done(self, now: float) -> None:
+        _log.debug("[InputManager] Pico → RHYTHM:BEST_SCORE_DONE")
+        self._pico_best_score_done = True
+
+    def _on_next_sf2(self, ev: InputEvent, now: float) -> None:
+        audio = self._get_audio_engine()
+        if audio is not None:
+            try:
+                audio.cycle_soundfont()
+            except Exception as e:
+                _log.error("[InputManager] audio.cycle_soundfont error: %s", e)
+
+    def _on_mode_switch(self, ev: InputEvent, now: float) -> None:
+        mode = _MODE_BY_NAME.get(ev.mode_name)
+        if mode is not None:
+            self._switch_mode(mode, now)
+
+    def _on_next_mode(self, ev: InputEvent, now: float) -> None:
+        self._cycle_mode(now)
+
+    def _on_note_on(self, ev: InputEvent, now: float) -> None:
+        # Song mode: KEY_3 button skips to the next track
+        if (
+            self.current_mode == Mode.SONG
+            and ev.key == KeyId.KEY_3
+            and ev.source == _BUTTON
+        ):
+            try:
+                self.song.skip_to_next(now)
+            except Exception as e:
+                _log.error("[InputManager] song.skip_to_next error: %s", e)
 
     def handle_events(self, events: List[InputEvent], now: float) -> None:
+        # Global actions first (one dict lookup per event), then the mode handler.
+        handlers = self._global_handlers
         for ev in events:
-            if ev.type == EventType.NEXT_SF2:
-                audio = self._get_audio_engine()
-                if audio is not None:
-                    try:
-                        audio.cycle_soundfont()
-                    except Exception as e:
-                        print("[InputManager] audio.cycle_soundfont error:", e)
-                continue
-
-            if ev.type == EventType.MODE_SWITCH and ev.mode_name:
-                self._switch_mode(ev.mode_name, now)
-                continue
-
-            if ev.type == EventType.NEXT_MODE:
-                self._cycle_mode(now)
-                continue
-
-            if (
-                self.current_mode == "song"
-                and ev.type == EventType.NOTE_ON
-                and ev.key == KeyId.KEY_3
-                and getattr(ev, "source", None) == "button"
-            ):
-                try:
-                    self.song.skip_to_next(now)
-                except Exception as e:
-                    print("[InputManager] song.skip_to_next error:", e)
-                continue
-
-        if self.current_mode == "menu":
-            if hasattr(self.menu, "handle_events"):
-                self.menu.handle_events(events)
+            handler = handlers.get(ev.type)
+            if handler is not None:
+                handler(ev, now)
+
+        if self.current_mode == Mode.MENU:
+            if self._menu_handle is not None:
+                self._menu_handle(events)
+
+        elif self.current_mode == Mode.PIANO:
+            filtered = self._filtered_buf
+            filtered.clear()
+            filtered.extend(
+                ev
+                for ev in events
+                if not (ev.type in _NOTE_TYPES and ev.source == _BUTTON)
+            )
+            if self._piano_handle is not None:
+                self._piano_handle(filtered)
 
-        elif self.current_mode == "piano":
-            filtered: List[InputEvent] = []
-            for ev in events:
-                if ev.type in (EventType.NOTE_ON, EventType.NOTE_OFF):
-                    if getattr(ev, "source", None) == "button":
-                        continue
-                filtered.append(ev)
-            if hasattr(self.piano, "handle_events"):
-                self.piano.handle_events(filtered)
-
-        elif self.current_mode == "rhythm":
+        elif self.current_mode == Mode.RHYTHM:
             # During post-game timeline, ignore inputs
             if self._rhythm_is_in_postgame():
                 return
             self._handle_rhythm_events(events, now)
 
-        elif self.current_mode == "song":
-            if hasattr(self.song, "handle_events"):
-                self.song.handle_events(events)
+        elif self.current_mode == Mode.SONG:
+            if self._song_handle is not None:
+                self._song_handle(events)
 
     def _handle_rhythm_events(self, events: List[InputEvent], now: float) -> None:
-        phase = getattr(self.rhythm, "phase", None)
+        phase_id = self.rhythm.phase_id
 
-        if phase == "WAIT_COUNTDOWN":
+        if phase_id == PHASE_WAIT_COUNTDOWN:
             for ev in events:
                 if ev.type != EventType.NOTE_ON:
                     continue
-                if getattr(ev, "source", None) != "button":
+                if ev.source != _BUTTON:
                     continue
                 if ev.key is None:
                     continue
@@ -232,36 +346,42 @@ class InputManager:
                 try:
                     self.rhythm.set_difficulty(difficulty)
                 except Exception as e:
-                    print(f"[InputManager] rhythm.set_difficulty('{difficulty}') error:", e)
+                    _log.error("[InputManager] rhythm.set_difficulty(%r) error: %s", difficulty, e)
 
-                print(f"[InputManager] Rhythm difficulty selected: {difficulty}")
+                _log.info("[InputManager] Rhythm difficulty selected: %s", difficulty)
 
                 if self.pico_display is not None:
                     try:
                         self.pico_display.send_rhythm_level(difficulty)
                     except Exception as e:
-                        print("[InputManager] pico_display.send_rhythm_level error:", e)
+                        _log.error("[InputManager] pico_display.send_rhythm_level error: %s", e)
 
                 return
             return
 
-        if phase == "PLAY":
+        if phase_id == PHASE_PLAY:
             button_events: List[InputEvent] = [
                 ev
                 for ev in events
-                if getattr(ev, "source", None) == "button"
-                and ev.type in (EventType.NOTE_ON, EventType.NOTE_OFF)
+                if ev.source == _BUTTON and ev.type in _NOTE_TYPES
             ]
-            if button_events and hasattr(self.rhythm, "handle_events"):
-                self.rhythm.handle_events(button_events)
+            if button_events and self._rhythm_handle is not None:
+                self._rhythm_handle(button_events)
             return
 
-    def _maybe_run_rhythm_postgame_timeline(self, now: float) -> None:
-        phase = getattr(self.rhythm, "phase", None)
+    @staticmethod
+    def _safe(fn: Callable[..., None], *args) -> None:
+        # Post-game steps are best-effort: log a failure and carry on.
+        try:
+            fn(*args)
+        except Exception as e:
+            _log.error("[InputManager] %s error: %s", getattr(fn, "__qualname__", fn), e)
 
-        if phase != "DONE":
+    def _maybe_run_rhythm_postgame_timeline(self, now: float) -> None:
+        if self.rhythm.phase_id != PHASE_DONE:
             self._rhythm_postgame_started = False
             self._rhythm_postgame_stage = None
+            self._rhythm_postgame_eligible = False
             self._pico_best_score_done = False
             return
 
@@ -270,7 +390,8 @@ class InputManager:
 
         if not self._rhythm_postgame_started:
             self._rhythm_postgame_started = True
-            self._rhythm_postgame_stage = "result_scroll"
+            self._rhythm_postgame_stage_idx = 0
+            self._rhythm_postgame_stage = self._postgame_stages[0][0]
             self._rhythm_postgame_t0 = now
             self._pico_best_score_done = False
 
@@ -287,128 +408,122 @@ class InputManager:
             best_after = max(best_before, score)
             self._rhythm_last_best = best_after
 
-            print(
-                f"[InputManager] Rhythm DONE: {score}/{max_score}, "
-                f"best={best_before}→{best_after}, diff={difficulty}, "
-                f"new_record={is_new_record}"
+            _log.info(
+                "[InputManager] Rhythm DONE: %s/%s, best=%s→%s, diff=%s, new_record=%s",
+                score, max_score, best_before, best_after, difficulty, is_new_record,
             )
 
-            try:
-                if is_new_record:
-                    self.pico_display.send_rhythm_challenge_success()
-                else:
-                    self.pico_display.send_rhythm_challenge_fail()
-            except Exception as e:
-                print("[InputManager] pico_display.send_rhythm_challenge_* error:", e)
+            if is_new_record:
+                self._safe(self.pico_display.send_rhythm_challenge_success)
+            else:
+                self._safe(self.pico_display.send_rhythm_challenge_fail)
 
             return
 
-        stage = self._rhythm_postgame_stage
-        elapsed = now - self._rhythm_postgame_t0
+        # Advance through as many stages as the elapsed time allows, so a
+        # main-loop stall doesn't leave the timeline trailing behind. Timed
+        # stages move t0 forward by their own duration (not to `now`), so
+        # any overshoot rolls into the next stage.
+        stages = self._postgame_stages
+        while self._rhythm_postgame_stage is not None:
+            _name, duration, on_end = stages[self._rhythm_postgame_stage_idx]
+            if duration is None:
+                if not self._pico_best_score_done:
+                    return
+                # Timing restarts at the handshake, not at the previous stage
+                next_t0 = now
+            else:
+                if now - self._rhythm_postgame_t0 < duration:
+                    return
+                next_t0 = self._rhythm_postgame_t0 + duration
+
+            on_end(now)
+            if self._rhythm_postgame_stage is None:
+                return
 
-        if stage == "result_scroll":
-            if elapsed >= 4.0:
-                try:
-                    self.pico_display.send_rhythm_user_score_label()
-                except Exception as e:
-                    print("[InputManager] pico_display.send_rhythm_user_score_label error:", e)
-                self._rhythm_postgame_stage = "user_label"
-                self._rhythm_postgame_t0 = now
-
-        elif stage == "user_label":
-            if elapsed >= 3.0:
-                score = self._rhythm_last_score
-                max_score = self._rhythm_last_max_score
-                user_text = f"{score}/{max_score}" if max_score > 0 else str(score)
-                try:
-                    self.pico_display.send_rhythm_user_score(user_text)
-                except Exception as e:
-                    print("[InputManager] pico_display.send_rhythm_user_score error:", e)
-                self._rhythm_postgame_stage = "user_score"
-                self._rhythm_postgame_t0 = now
+            self._rhythm_postgame_stage_idx += 1
+            self._rhythm_postgame_stage = stages[self._rhythm_postgame_stage_idx][0]
+            self._rhythm_postgame_t0 = next_t0
 
-        elif stage == "user_score":
-            if elapsed >= 3.0:
-                try:
-                    self.pico_display.send_rhythm_best_score_label()
-                except Exception as e:
-                    print("[InputManager] pico_display.send_rhythm_best_score_label error:", e)
-                self._rhythm_postgame_stage = "best_label"
-                self._rhythm_postgame_t0 = now
+    def _postgame_send_user_label(self, now: float) -> None:
+        self._safe(self.pico_display.send_rhythm_user_score_label)
 
-        elif stage == "best_label":
-            # You set this short; OK as long as Pico doesn't queue BEST_SCORE behind marquee.
-            if elapsed >= 1.0:
-                best = self._rhythm_last_best
-                max_score = self._rhythm_last_max_score
-                best_text = f"{best}/{max_score}" if max_score > 0 else str(best)
-                try:
-                    self.pico_display.send_rhythm_best_score(best_text)
-                except Exception as e:
-                    print("[InputManager] pico_display.send_rhythm_best_score error:", e)
-                self._rhythm_postgame_stage = "best_score_wait_done"
-                self._rhythm_postgame_t0 = now
+    def _postgame_send_user_score(self, now: float) -> None:
+        score = self._rhythm_last_score
+        max_score = self._rhythm_last_max_score
+        user_text = f"{score}/{max_score}" if max_score > 0 else str(score)
+        self._safe(self.pico_display.send_rhythm_user_score, user_text)
 
-        elif stage == "best_score_wait_done":
-            # Key sync point: only when Pico tells us BEST score display finished
-            if self._pico_best_score_done:
-                # 1) Make Pico jump back to RYTHM.bmp immediately
-                try:
-                    self.pico_display.send_rhythm_back_to_title()
-                except Exception as e:
-                    print("[InputManager] pico_display.send_rhythm_back_to_title error:", e)
+    def _postgame_send_best_label(self, now: float) -> None:
+        self._safe(self.pico_display.send_rhythm_best_score_label)
 
-                # 2) At the SAME time, start Pi difficulty colors overlay for exactly the title duration
-                self._rhythm_postgame_stage = "pi_colors_during_title"
-                self._rhythm_postgame_t0 = now
+    def _postgame_send_best_score(self, now: float) -> None:
+        best = self._rhythm_last_best
+        max_score = self._rhythm_last_max_score
+        best_text = f"{best}/{max_score}" if max_score > 0 else str(best)
+        self._safe(self.pico_display.send_rhythm_best_score, best_text)
 
-        elif stage == "pi_colors_during_title":
-            # We don't call rhythm.reset yet; keep showing colors for the same duration as Pico's RYTHM.bmp
-            if elapsed >= float(self._pi_colors_during_title_sec):
-                try:
-                    self.rhythm.reset(now)
-                except Exception as e:
-                    print("[InputManager] rhythm.reset error after post-game:", e)
+    def _postgame_back_to_title(self, now: float) -> None:
+        # Make Pico jump back to RYTHM.bmp; Pi difficulty colors start at the same time
+        self._safe(self.pico_display.send_rhythm_back_to_title)
+
+    def _postgame_finish(self, now: float) -> None:
+        # Title window over: reset rhythm to difficulty select and disarm the timeline
+        self._safe(self.rhythm.reset, now)
 
-                self._rhythm_postgame_started = False
-                self._rhythm_postgame_stage = None
-                self._pico_best_score_done = False
+        self._rhythm_postgame_started = False
+        self._rhythm_postgame_stage = None
+        self._rhythm_postgame_eligible = False
+        self._pico_best_score_done = False
 
     def update(self, now: float) -> None:
+        # Pico commands issued during this frame go out as one serial write.
+        pico = self.pico_display
+        if pico is None:
+            self._update_frame(now)
+            return
+
+        pico.begin_batch()
+        try:
+            self._update_frame(now)
+        finally:
+            pico.end_batch()
+
+    def _update_frame(self, now: float) -> None:
         # 1) Poll Pico messages
         if self.pico_display is not None:
             try:
                 messages = self.pico_display.poll_messages()
             except Exception as e:
-                print("[InputManager] pico_display.poll_messages error:", e)
+                _log.error("[InputManager] pico_display.poll_messages error: %s", e)
                 messages = []
             for msg in messages:
                 self._handle_pico_message(msg, now)
 
         # 2) Normal mode updates
-        if self.current_mode == "menu":
-            if hasattr(self.menu, "update"):
-                self.menu.update(now)
+        if self.current_mode == Mode.MENU:
+            if self._menu_update is not None:
+                self._menu_update(now)
 
-        elif self.current_mode == "piano":
-            if hasattr(self.piano, "update"):
-                self.piano.update(now)
+        elif self.current_mode == Mode.PIANO:
+            if self._piano_update is not None:
+                self._piano_update(now)
 
-        elif self.current_mode == "rhythm":
+        elif self.current_mode == Mode.RHYTHM:
             # Post-game (phase==DONE) stage: do NOT call rhythm.update()
-            phase = getattr(self.rhythm, "phase", None)
-            in_postgame = (phase == "DONE" and self._rhythm_is_in_postgame())
+            in_postgame = (self.rhythm.phase_id == PHASE_DONE and self._rhythm_is_in_postgame())
             if not in_postgame:
-                if hasattr(self.rhythm, "update"):
-                    self.rhythm.update(now)
+                if self._rhythm_update is not None:
+                    self._rhythm_update(now)
 
-            # Post-game controller (still runs)
-            self._maybe_run_rhythm_postgame_timeline(now)
+            # Post-game controller (only armed once the run has finished)
+            if self._rhythm_postgame_eligible:
+                self._maybe_run_rhythm_postgame_timeline(now)
 
             # During title sync window, ONLY InputManager drives Pi LEDs
             if self._rhythm_postgame_stage == "pi_colors_during_title":
                 self._render_pi_difficulty_colors()
 
-        elif self.current_mode == "song":
-            if hasattr(self.song, "update"):
-                self.song.update(now)
+        elif self.current_mode == Mode.SONG:
+            if self._song_update is not None:
+                self._song_update(now)
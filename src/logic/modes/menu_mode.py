@@ -20,12 +20,61 @@ class MenuMode:
           with a shimmering / wave-like brightness animation.
 
     NOTE:
-        This mode uses a flipped-y helper _set() so that logical (0,0)
-        is the TOP-LEFT of the panel.
+        The title is laid out with logical (0,0) at the TOP-LEFT of the
+        panel; _build_text_pi_ano() flips y when rasterizing it.
     """
 
+    # Small 3x5 font used for the "Pi-ANO" title
+    FONT = {
+        "P": [
+            "###",
+            "#.#",
+            "###",
+            "#..",
+            "#..",
+        ],
+        "I": [
+            "###",
+            ".#.",
+            ".#.",
+            ".#.",
+            "###",
+        ],
+        "A": [
+            ".#.",
+            "#.#",
+            "###",
+            "#.#",
+            "#.#",
+        ],
+        "N": [
+            "#.#",
+            "##.",
+            "#.#",
+            "#.#",
+            "#.#",
+        ],
+        "O": [
+            "###",
+            "#.#",
+            "#.#",
+            "#.#",
+            "###",
+        ],
+        "-": [
+            "...",
+            "...",
+            "###",
+            "...",
+            "...",
+        ],
+    }
+
     def __init__(self, led: LedMatrix) -> None:
         self.led = led
+        # Panel size never changes; cache it for the title rasterizer
+        self._W: int = led.width
+        self._H: int = led.height
         self.start_time: float | None = None
 
         # Background color
@@ -59,6 +108,25 @@ class MenuMode:
             (225, 185, 255),  # lavender
         ]
 
+        # "Pi-ANO" never changes: rasterize it once into physical
+        # (x, y, color) pixels and just replay them each frame.
+        self._pi_ano_pixels = self._build_text_pi_ano(y_offset=2)
+
+        # Full-saturation, full-value rainbow sampled at 256 hues. HSV value
+        # scales RGB linearly, so shimmer colors are just LUT entry * value.
+        self._hue_lut = tuple(colorsys.hsv_to_rgb(i / 256, 1.0, 1.0) for i in range(256))
+
+        # Shimmer animation constants (fixed for the lifetime of the mode)
+        self._hue_speed = 0.1       # how fast the rainbow hue moves (smaller = slower)
+        self._breathe_speed = 2.0   # how fast the brightness breathes
+
+        # Per-key (base hue offset, breathe phase offset): spread keys across
+        # the rainbow and stagger their pulses so the wave flows sideways.
+        num_keys = len(self.menu_keys)
+        self._shimmer_offsets = tuple(
+            (idx / max(1, num_keys), idx * 0.7) for idx in range(num_keys)
+        )
+
     # ---------------- public API ----------------
 
     def reset(self, now: float) -> None:
@@ -91,7 +159,7 @@ class MenuMode:
         self.led.clear_all()
 
         # 2) Draw "Pi-ANO" text (near the top)
-        self._draw_text_pi_ano(y_offset=2)
+        self._draw_text_pi_ano()
 
         # 3) Draw shimmering 5-key gradient
         self._draw_shimmer_keys(t)
@@ -101,36 +169,31 @@ class MenuMode:
 
     # ---------------- helpers ----------------
 
-    def _set(self, x: int, y: int, color) -> None:
-        """
-        Map logical (x, y) to physical LED coordinates with a flipped y-axis.
-        Logical (0,0) is top-left; physical uses (0, height-1) as bottom-left.
-        """
-        if not (0 <= x < self.led.width and 0 <= y < self.led.height):
-            return
-        flipped_y = self.led.height - 1 - y
-        self.led.set_xy(x, flipped_y, color)
-
-    def _draw_text_pi_ano(self, y_offset: int) -> None:
+    def _build_text_pi_ano(self, y_offset: int) -> tuple:
         """
-        Draw "Pi-ANO" using a 3x5 font, horizontal centering,
-        and per-letter colors.
+        Rasterize "Pi-ANO" using a 3x5 font, horizontal centering,
+        and per-letter colors. Returns physical (x, y, color) pixels
+        (y already flipped, off-panel pixels dropped).
         """
         text = "PI-ANO"
         char_w = 3
         char_h = 5
         spacing = 1
 
+        width = self._W
+        height = self._H
+
         total_width = len(text) * char_w + (len(text) - 1) * spacing
-        left_x = (self.led.width - total_width) // 2
+        left_x = (width - total_width) // 2
 
+        pixels = []
         for i, ch in enumerate(text):
-            glyph = self._font().get(ch.upper())
+            glyph = self.FONT.get(ch.upper())
             if glyph is None:
                 continue
 
             x_offset = left_x + i * (char_w + spacing)
-            if x_offset >= self.led.width:
+            if x_offset >= width:
                 break
 
             color = (
@@ -140,14 +203,26 @@ class MenuMode:
             )
 
             for gy in range(char_h):
-                if y_offset + gy >= self.led.height:
+                y = y_offset + gy
+                if not (0 <= y < height):
                     continue
                 row = glyph[gy]
                 for gx in range(char_w):
-                    if x_offset + gx >= self.led.width:
+                    x = x_offset + gx
+                    if not (0 <= x < width):
                         continue
                     if row[gx] == "#":
-                        self._set(x_offset + gx, y_offset + gy, color)
+                        pixels.append((x, height - 1 - y, color))
+
+        return tuple(pixels)
+
+    def _draw_text_pi_ano(self) -> None:
+        """
+        Draw the pre-rasterized "Pi-ANO" text.
+        """
+        set_xy = self.led.set_xy
+        for x, y, color in self._pi_ano_pixels:
+            set_xy(x, y, color)
 
     def _draw_shimmer_keys(self, t: float) -> None:
         """
@@ -158,83 +233,23 @@ class MenuMode:
             - Neighboring keys have a phase offset so the rainbow flows.
             - Brightness also breathes (like a soft pulse).
         """
-        num_keys = len(self.menu_keys)
-
-        # How fast the rainbow hue moves over time
-        hue_speed = 0.1   # smaller = slower rainbow
-        # How fast the brightness breathes
-        breathe_speed = 2.0
-
-        for idx, key in enumerate(self.menu_keys):
-            # Base hue offset per key (spread keys across the rainbow)
-            base_hue_offset = idx / max(1, num_keys)
+        lut = self._hue_lut
+        hue_shift = t * self._hue_speed
+        breathe_t = t * self._breathe_speed
 
+        colors = []
+        for base_hue_offset, phase_offset in self._shimmer_offsets:
             # Time-based hue shift
-            hue = (base_hue_offset + t * hue_speed) % 1.0
+            hue = (base_hue_offset + hue_shift) % 1.0
 
             # Breathing brightness: value in [0.4, 1.0]
-            breathe_phase = t * breathe_speed + idx * 0.7
-            wave = 0.5 + 0.5 * math.sin(breathe_phase)
+            wave = 0.5 + 0.5 * math.sin(breathe_t + phase_offset)
             value = 0.4 + 0.6 * wave  # V in HSV
 
-            # Full saturation for vivid colors
-            sat = 1.0
-
-            # HSV → RGB (each in [0, 1])
-            r_f, g_f, b_f = colorsys.hsv_to_rgb(hue, sat, value)
-
-            # Convert to 0–255
-            r = int(r_f * 255)
-            g = int(g_f * 255)
-            b = int(b_f * 255)
-
-            # Paint this key; brightness baked into the color
-            self.led.fill_key(key, (r, g, b), brightness=1.0)
-
-    # Lazily build the small 3x5 font
-    def _font(self):
-        return {
-            "P": [
-                "###",
-                "#.#",
-                "###",
-                "#..",
-                "#..",
-            ],
-            "I": [
-                "###",
-                ".#.",
-                ".#.",
-                ".#.",
-                "###",
-            ],
-            "A": [
-                ".#.",
-                "#.#",
-                "###",
-                "#.#",
-                "#.#",
-            ],
-            "N": [
-                "#.#",
-                "##.",
-                "#.#",
-                "#.#",
-                "#.#",
-            ],
-            "O": [
-                "###",
-                "#.#",
-                "#.#",
-                "#.#",
-                "###",
-            ],
-            "-": [
-                "...",
-                "...",
-                "###",
-                "...",
-                "...",
-            ],
-        }
+            # Full-saturation HSV → RGB via the hue LUT, scaled to 0–255
+            r_f, g_f, b_f = lut[int(hue * 256) & 255]
+            scale = value * 255
+            colors.append((int(r_f * scale), int(g_f * scale), int(b_f * scale)))
 
+        # Paint all keys in one call; brightness is baked into the colors
+        self.led.fill_keys(self.menu_keys, colors)
@@ -0,0 +1,150 @@
+# src/logic/modes/midi_parse.py
+"""
+MIDI file → note events, for MidiSongMode.
+
+Currently contains:
+    - MidiNoteEvent: one note (start, end, pitch, velocity) on the song timeline
+    - note_messages / pair_note_events: the two parsing passes
+    - parse_midi_file: both passes on a file path
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List
+
+import mido
+
+
+@dataclass(slots=True)
+class MidiNoteEvent:
+    """One note from the MIDI file on a global timeline."""
+    start_time: float      # seconds from song start
+    end_time: float        # seconds from song start
+    midi_note: int         # 0~127
+    velocity: int          # raw MIDI velocity 1~127
+
+
+def note_messages(mid: mido.MidiFile) -> List[tuple[float, int, int]]:
+    """
+    Flatten a MIDI file to time-ordered (time_sec, midi_note, velocity) note
+    messages (velocity 0 = note off).
+
+    Walks the raw tracks instead of `for msg in mid`: that merges every
+    message (CC, pitch bend, meta...) into one stream and builds per-message
+    seconds copies. Here a tempo map is built from set_tempo messages
+    first, then each track is scanned with non-note messages skipped
+    before any timing work.
+    """
+    tpb = mid.ticks_per_beat
+
+    # 1) Tempo map: (tick, tempo) changes from all tracks, in tick order
+    changes: List[tuple[int, int]] = []
+    for track in mid.tracks:
+        tick = 0
+        for msg in track:
+            tick += msg.time
+            if msg.type == "set_tempo":
+                changes.append((tick, msg.tempo))
+    changes.sort(key=lambda c: c[0])
+
+    # Segments of constant tempo: start tick, start second, seconds per tick
+    seg_ticks: List[int] = [0]
+    seg_secs: List[float] = [0.0]
+    seg_scale: List[float] = [500000 * 1e-6 / tpb]  # MIDI default 120 bpm
+    for tick, tempo in changes:
+        start_sec = seg_secs[-1] + (tick - seg_ticks[-1]) * seg_scale[-1]
+        if tick == seg_ticks[-1]:
+            seg_scale[-1] = tempo * 1e-6 / tpb
+            continue
+        seg_ticks.append(tick)
+        seg_secs.append(start_sec)
+        seg_scale.append(tempo * 1e-6 / tpb)
+    n_segs = len(seg_ticks)
+
+    # 2) Note messages, track by track (ticks only grow within a track,
+    #    so the tempo segment index only moves forward)
+    note_msgs: List[tuple[float, int, int]] = []
+    append = note_msgs.append
+    for track in mid.tracks:
+        tick = 0
+        seg = 0
+        for msg in track:
+            tick += msg.time
+            msg_type = msg.type
+            # note_on with velocity 0 is the running-status form of note_off
+            if msg_type == "note_on":
+                velocity = msg.velocity
+            elif msg_type == "note_off":
+                velocity = 0
+            else:
+                continue
+
+            while seg + 1 < n_segs and seg_ticks[seg + 1] <= tick:
+                seg += 1
+            time_s = seg_secs[seg] + (tick - seg_ticks[seg]) * seg_scale[seg]
+
+            append((time_s, msg.note, velocity))
+
+    # Merge tracks; the sort is stable, so same-time messages keep track order
+    # (matching mido's merged playback order).
+    note_msgs.sort(key=lambda m: m[0])
+    return note_msgs
+
+
+def pair_note_events(note_msgs) -> List[MidiNoteEvent]:
+    """
+    Pair note-on / note-off messages into MidiNoteEvent spans, sorted by start.
+
+    note_msgs: time-ordered (time_sec, midi_note, velocity) tuples, where
+    velocity 0 means note off. Open notes live in 128-slot scratch lists
+    indexed by MIDI note (start < 0 = not sounding) instead of a dict.
+    """
+    open_start: List[float] = [-1.0] * 128
+    open_vel: List[int] = [0] * 128
+    events: List[MidiNoteEvent] = []
+    append = events.append
+
+    for time_s, note, velocity in note_msgs:
+        if velocity > 0:
+            open_start[note] = time_s
+            open_vel[note] = velocity
+            continue
+
+        start_time = open_start[note]
+        if start_time < 0.0:
+            continue
+        open_start[note] = -1.0
+        if time_s > start_time:
+            append(
+                MidiNoteEvent(
+                    start_time=start_time,
+                    end_time=time_s,
+                    midi_note=note,
+                    velocity=open_vel[note],
+                )
+            )
+
+    # Fallback for notes without explicit note_off
+    for note in range(128):
+        start_time = open_start[note]
+        if start_time >= 0.0:
+            append(
+                MidiNoteEvent(
+                    start_time=start_time,
+                    end_time=start_time + 0.5,
+                    midi_note=note,
+                    velocity=open_vel[note],
+                )
+            )
+
+    events.sort(key=lambda e: e.start_time)
+    return events
+
+
+def parse_midi_file(midi_path: Path) -> List[MidiNoteEvent]:
+    """
+    Parse one MIDI file into MidiNoteEvents sorted by start time.
+    """
+    return pair_note_events(note_messages(mido.MidiFile(midi_path)))
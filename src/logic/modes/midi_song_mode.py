@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Optional
+
+from array import array
+from bisect import bisect_right
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 
-import random
 import math
-import mido
+import os
+import pickle
+import tempfile
 
 from src.hardware.led.led_matrix import LedMatrix
 from src.hardware.config.keys import (
@@ -18,27 +23,49 @@ from src.hardware.config.keys import (
 )
 from src.hardware.audio.audio_engine import AudioEngine
 from src.logic.input_event import InputEvent, EventType
+from src.logic.modes.midi_parse import MidiNoteEvent, parse_midi_file
 
 
-# ---------------------------------------------------------------------------
-# Data classes
-# ---------------------------------------------------------------------------
+# After this many audio batch failures in a row, song mode stops calling
+# the audio engine (plays LEDs only) instead of failing on every frame.
+_MAX_AUDIO_FAILURES = 3
+
+# Bump when the cached event format changes so stale caches are re-parsed.
+_EVENT_CACHE_VERSION = 3
+
+
+def _cache_path(midi_path: Path) -> Path:
+    """
+    File holding the parsed events of `midi_path`.
+    Kept in a .cache/ subfolder so the playlist glob ("*.mid*") never sees it.
+    """
+    return midi_path.parent / ".cache" / (midi_path.name + ".pkl")
+
 
-@dataclass
-class MidiNoteEvent:
-    """One note from the MIDI file on a global timeline."""
-    start_time: float      # seconds from song start
-    end_time: float        # seconds from song start
-    midi_note: int         # 0~127
-    velocity: float        # 0.0 ~ 1.0
+@lru_cache(maxsize=8)
+def _scan_midi_folder(folder: str) -> tuple[Path, ...]:
+    """
+    Sorted MIDI files in `folder` (sorted = deterministic playlist order).
+    Cached per folder so rebuilding the mode doesn't rescan the SD card;
+    call `_scan_midi_folder.cache_clear()` to pick up new files.
+    """
+    return tuple(sorted(p for p in Path(folder).glob("*.mid*") if p.is_file()))
 
 
-@dataclass
-class ActiveLedNote:
-    """A note currently lighting a LED key zone."""
-    key: KeyId
-    velocity: float
-    end_time: float
+_NUM_KEYS = len(KeyId)
+
+# HSV sector (int(h * 6) % 6) → which of (v, p, q, t) feeds (R, G, B)
+_HSV_SECTOR: tuple[tuple[int, int, int], ...] = (
+    (0, 3, 1),  # v, t, p
+    (2, 0, 1),  # q, v, p
+    (1, 0, 3),  # p, v, t
+    (1, 2, 0),  # p, q, v
+    (3, 1, 0),  # t, p, v
+    (0, 1, 2),  # v, p, q
+)
+
+# MIDI note (0..127) → LED key: (note - C4) % 5 → KEY_0..KEY_4
+_NOTE_TO_KEY: tuple[KeyId, ...] = tuple(KeyId((n - 60) % 5) for n in range(128))
 
 
 # ---------------------------------------------------------------------------
@@ -74,60 +101,121 @@ class MidiSongMode:
         self.start_time: Optional[float] = None
 
         # --- build playlist (sorted = deterministic order) ---
-        folder = Path(midi_folder)
-        self.playlist: List[Path] = sorted(
-            [p for p in folder.glob("*.mid*") if p.is_file()]
-        )
+        self.playlist: tuple[Path, ...] = _scan_midi_folder(str(midi_folder))
         if not self.playlist:
-            raise FileNotFoundError(f"No MIDI files found in folder: {folder}")
+            _scan_midi_folder.cache_clear()  # don't remember the empty scan
+            raise FileNotFoundError(f"No MIDI files found in folder: {Path(midi_folder)}")
+        # Playlist is fixed after construction
+        self._n_songs: int = len(self.playlist)
 
         # index of current song within playlist (0..len-1)
         self._song_index: int = 0
 
         self.current_song: Optional[Path] = None
-        self.events: List[MidiNoteEvent] = []
+        # Current song as parallel typed arrays sorted by start time (struct of
+        # arrays: the scheduler reads packed slots instead of event objects),
+        # plus the event indices ordered by end time for NOTE_OFF scheduling.
+        # Times are integer milliseconds and velocities raw MIDI 0~127: that is
+        # all the precision playback needs, and int compares are cheaper.
+        self._starts: array = array("l")
+        self._ends: array = array("l")
+        self._notes: array = array("B")
+        self._vels: array = array("B")
+        self._strengths: List[float] = []     # LED highlight strength per event
+        self._keys: List[KeyId] = []          # LED key of each event's note
+        self._off_order: array = array("L")
+        self._off_times: array = array("l")   # end times in _off_order order (ascending)
         self.next_on_index: int = 0
         self.next_off_index: int = 0
-        self.active_led_notes: Dict[KeyId, ActiveLedNote] = {}
+        # LED key state, indexed by key id: end time (ms) of the note lighting
+        # the key (-1 = idle), and its highlight strength (0.0 = idle, else
+        # 0.2~1.0 from velocity).
+        self._active_end: array = array("l", [-1] * _NUM_KEYS)
+        self._active_strength: List[float] = [0.0] * _NUM_KEYS
 
         # Precompute x → key mapping for the LED matrix
-        self._x_to_key: Dict[int, Optional[KeyId]] = self._build_x_to_key()
+        self._x_to_key: tuple[int, ...] = self._build_x_to_key()
 
         # Parameters for rainbow animation
         self.rainbow_time_speed: float = 0.06   # how fast hue cycles over time
         self.rainbow_spatial_span: float = 0.35 # hue difference from left to right
 
+        # Rainbow sampled at 256 hues with V=1, as 0~255 ints, for key columns
+        # (S=1.0) and border columns (S=0.9). HSV value scales RGB linearly,
+        # so a column color is just LUT entry * v / 255 — all integer math.
+        self._hue_lut = self._build_hue_lut(1.0)
+        self._hue_lut_border = self._build_hue_lut(0.9)
+
+        # Vertical brightness bump per row (brighter in the middle), in 8.8
+        # fixed point (256 = 1.0); depends only on y, so computed once here.
+        height = self.led.height
+        self._y_bump: List[int] = [
+            int((1.0 + 0.15 * math.cos((y / max(1, height - 1) - 0.5) * math.pi)) * 256 + 0.5)
+            for y in range(height)
+        ]
+
         # When receiving EventType.NEXT_SONG (from keyboard "next"), we set a flag
         # and handle the actual skip in update(now), which has the proper timestamp.
         self._skip_requested: bool = False
 
+        # Consecutive audio batch failures (see _send_audio)
+        self._audio_failures: int = 0
+
+        # Background parsing of the upcoming song, so a song change doesn't
+        # stall the frame loop on mido. (playlist index, pending events)
+        self._prefetch_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="midi-prefetch")
+        self._prefetch: Optional[tuple[int, Future]] = None
+
+        # What the panel currently shows: the rainbow's hue step (LUT index
+        # shift) and hue base, plus the key strengths it was drawn with. Same
+        # step → only key columns whose strength changed are repainted.
+        self._last_hue_step: Optional[int] = None
+        self._last_hue_base: float = 0.0
+        self._last_strength: List[float] = [0.0] * _NUM_KEYS
+
+        # Full-frame buffer (row-major RGB tuples), allocated once and
+        # overwritten in place on every full redraw
+        self._frame: List[tuple[int, int, int]] = [(0, 0, 0)] * (self.led.width * height)
+
+        # Columns of each key zone (indexed by key id), for repainting single keys
+        self._key_columns: List[List[int]] = [[] for _ in range(_NUM_KEYS)]
+        for x, key_id in enumerate(self._x_to_key):
+            if key_id >= 0:
+                self._key_columns[key_id].append(x)
+
     # ------------------------------------------------------------------
     # x → key mapping
     # ------------------------------------------------------------------
-    def _build_x_to_key(self) -> Dict[int, Optional[KeyId]]:
+    def _build_x_to_key(self) -> tuple[int, ...]:
         """
-        Build a mapping from x-column to KeyId (or None if that x is border).
+        Build a flat x-column → key-id table (int(KeyId), or -1 if that x is border).
 
         Uses KEY_ZONES from the central key config.
         Assumes KEY_ZONES[x0, x1] are inclusive ranges.
         """
-        mapping: Dict[int, Optional[KeyId]] = {}
         width = self.led.width
-
-        for x in range(width):
-            mapping[x] = None
+        mapping: List[int] = [-1] * width
 
         for key, (x0, x1) in KEY_ZONES.items():
             start = max(0, x0)
             end = min(width - 1, x1)
             for x in range(start, end + 1):
-                mapping[x] = key
+                mapping[x] = int(key)
 
-        return mapping
+        return tuple(mapping)
 
     # ------------------------------------------------------------------
     # Small HSV → RGB helper (0.0~1.0 → 0~255)
     # ------------------------------------------------------------------
+    @staticmethod
+    def _build_hue_lut(saturation: float) -> tuple[tuple[int, int, int], ...]:
+        """
+        256-entry rainbow (hue i/256, V=1) as 0~255 RGB ints.
+        """
+        return tuple(
+            MidiSongMode._hsv_to_rgb(i / 256, saturation, 1.0) for i in range(256)
+        )
+
     @staticmethod
     def _hsv_to_rgb(h: float, s: float, v: float) -> tuple[int, int, int]:
         """
@@ -140,28 +228,18 @@ class MidiSongMode:
 
         i = int(h * 6.0)
         f = (h * 6.0) - i
-        p = v * (1.0 - s)
-        q = v * (1.0 - f * s)
-        t = v * (1.0 - (1.0 - f) * s)
-        i = i % 6
-
-        if i == 0:
-            r, g, b = v, t, p
-        elif i == 1:
-            r, g, b = q, v, p
-        elif i == 2:
-            r, g, b = p, v, t
-        elif i == 3:
-            r, g, b = p, q, v
-        elif i == 4:
-            r, g, b = t, p, v
-        else:
-            r, g, b = v, p, q
+        channels = (
+            v,                          # 0: v
+            v * (1.0 - s),              # 1: p
+            v * (1.0 - f * s),          # 2: q
+            v * (1.0 - (1.0 - f) * s),  # 3: t
+        )
+        ri, gi, bi = _HSV_SECTOR[i % 6]
 
         return (
-            int(r * 255 + 0.5),
-            int(g * 255 + 0.5),
-            int(b * 255 + 0.5),
+            int(channels[ri] * 255 + 0.5),
+            int(channels[gi] * 255 + 0.5),
+            int(channels[bi] * 255 + 0.5),
         )
 
     # ------------------------------------------------------------------
@@ -169,74 +247,103 @@ class MidiSongMode:
     # ------------------------------------------------------------------
     def _load_song_events(self, midi_path: Path) -> List[MidiNoteEvent]:
         """
-        Parse one MIDI file into a list of MidiNoteEvent.
-        """
-        mid = mido.MidiFile(midi_path)
-
-        events: List[MidiNoteEvent] = []
-        active: Dict[int, tuple[float, float]] = {}  # midi_note -> (start_time, velocity)
-        current_time = 0.0
-
-        for msg in mid:
-            current_time += msg.time  # already in seconds
-
-            if msg.type == "note_on" and msg.velocity > 0:
-                vel = msg.velocity / 127.0
-                active[msg.note] = (current_time, vel)
-
-            elif msg.type in ("note_off",) or (msg.type == "note_on" and msg.velocity == 0):
-                if msg.note in active:
-                    start_time, vel = active.pop(msg.note)
-                    end_time = current_time
-                    if end_time > start_time:
-                        events.append(
-                            MidiNoteEvent(
-                                start_time=start_time,
-                                end_time=end_time,
-                                midi_note=msg.note,
-                                velocity=vel,
-                            )
-                        )
-
-        # Fallback for notes without explicit note_off
-        for note, (start_time, vel) in active.items():
-            events.append(
-                MidiNoteEvent(
-                    start_time=start_time,
-                    end_time=start_time + 0.5,
-                    midi_note=note,
-                    velocity=vel,
-                )
-            )
+        Load one MIDI file as a list of MidiNoteEvent.
 
-        events.sort(key=lambda e: e.start_time)
+        Parsing with mido is slow for large files, so the result is cached
+        in a pickle next to the .mid and reused while the MIDI file's
+        mtime and size still match the ones it was parsed from.
+        """
+        events = self._read_event_cache(midi_path)
+        if events is None:
+            events = self._parse_song_events(midi_path)
+            self._write_event_cache(midi_path, events)
 
         if self.debug:
             print(f"[MidiSongMode] Loaded {len(events)} events from {midi_path.name}")
 
         return events
 
-    # MIDI note → 5 LED keys (mod 5)
-    def _midi_note_to_key(self, midi_note: int) -> KeyId:
+    def _read_event_cache(self, midi_path: Path) -> Optional[List[MidiNoteEvent]]:
         """
-        Map MIDI note to 5 keys using modulo-5.
-
-        - base C4 = 60
-        - (midi_note - base) % 5 -> 0..4 → KEY_0..KEY_4
+        Return cached events for midi_path, or None if missing/stale/unreadable.
+        """
+        cache = _cache_path(midi_path)
+        try:
+            st = midi_path.stat()
+            with cache.open("rb") as f:
+                data = pickle.load(f)
+            if data.get("version") != _EVENT_CACHE_VERSION:
+                return None
+            if data.get("source") != (st.st_mtime_ns, st.st_size):
+                return None
+            return [
+                MidiNoteEvent(start_time=start, end_time=end, midi_note=note, velocity=vel)
+                for start, end, note, vel in data["events"]
+            ]
+        except Exception:
+            return None
+
+    def _write_event_cache(self, midi_path: Path, events: List[MidiNoteEvent]) -> None:
+        """
+        Best-effort save of parsed events next to the MIDI file.
+        """
+        try:
+            st = midi_path.stat()
+        except OSError:
+            return
+        data = {
+            "version": _EVENT_CACHE_VERSION,
+            # MIDI file identity the events were parsed from
+            "source": (st.st_mtime_ns, st.st_size),
+            "events": [
+                (ev.start_time, ev.end_time, ev.midi_note, ev.velocity)
+                for ev in events
+            ],
+        }
+        cache = _cache_path(midi_path)
+        tmp_name = None
+        try:
+            cache.parent.mkdir(exist_ok=True)
+            # Write a private temp file and rename it into place, so a reader
+            # (or a crash mid-write) never sees a half-written pickle
+            with tempfile.NamedTemporaryFile(
+                "wb", dir=cache.parent, suffix=".tmp", delete=False
+            ) as f:
+                tmp_name = f.name
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_name, cache)
+            tmp_name = None
+        except OSError as e:
+            if self.debug:
+                print("[MidiSongMode] could not write event cache:", e)
+        finally:
+            if tmp_name is not None:
+                try:
+                    os.remove(tmp_name)
+                except OSError:
+                    pass
+
+    def _parse_song_events(self, midi_path: Path) -> List[MidiNoteEvent]:
         """
-        base = 60
-        idx = (midi_note - base) % 5
+        Parse one MIDI file into a list of MidiNoteEvent.
+        """
+        return parse_midi_file(midi_path)
 
-        if idx == 0:
-            return KeyId.KEY_0
-        elif idx == 1:
-            return KeyId.KEY_1
-        elif idx == 2:
-            return KeyId.KEY_2
-        elif idx == 3:
-            return KeyId.KEY_3
-        else:
-            return KeyId.KEY_4
+    def _set_events(self, events: List[MidiNoteEvent]) -> None:
+        """
+        Store a start-sorted event list as the parallel scheduling arrays.
+        """
+        self._starts = array("l", [round(ev.start_time * 1000) for ev in events])
+        self._ends = array("l", [round(ev.end_time * 1000) for ev in events])
+        self._notes = array("B", [ev.midi_note for ev in events])
+        # Velocity as sent to the synth (MIDI byte 1~127) and as LED
+        # highlight strength (0.2~1.0), both fixed per event
+        self._vels = array("B", [max(1, min(127, ev.velocity)) for ev in events])
+        self._strengths = [max(0.2, min(1.0, v / 127.0)) for v in self._vels]
+        self._keys = [_NOTE_TO_KEY[note] for note in self._notes]
+        ends = self._ends
+        self._off_order = array("L", sorted(range(len(events)), key=ends.__getitem__))
+        self._off_times = array("l", [ends[k] for k in self._off_order])
 
     # ------------------------------------------------------------------
     # Lifecycle / playlist control
@@ -245,23 +352,28 @@ class MidiSongMode:
         """
         Start playing song at playlist[index], with wrapping.
         """
-        n = len(self.playlist)
+        n = self._n_songs
         if n == 0:
             return
 
         self._song_index = index % n
         song_path = self.playlist[self._song_index]
 
-        # Random palette per song (can be changed to deterministic if needed)
-        palette = random.choice(KEY_COLOR_PALETTES)
+        # Palette per song, cycled deterministically with the playlist
+        palette = KEY_COLOR_PALETTES[self._song_index % len(KEY_COLOR_PALETTES)]
         self.led.set_key_palette(palette)
 
         self.current_song = song_path
-        self.events = self._load_song_events(song_path)
+        self._set_events(self._take_song_events(self._song_index))
         self.start_time = now
         self.next_on_index = 0
         self.next_off_index = 0
-        self.active_led_notes.clear()
+        self._clear_active_keys()
+        self._last_hue_step = None
+
+        # Parse the next song in the background while this one plays, so
+        # the change at the end of the song is just a swap
+        self._prefetch_song(self._song_index + 1)
 
         # Ensure all notes are off when we start
         if self.audio is not None:
@@ -273,6 +385,46 @@ class MidiSongMode:
                 f"song={song_path.name} at t={now:.3f}"
             )
 
+    def _prefetch_song(self, index: int) -> None:
+        """
+        Start parsing playlist[index] on the worker thread (if not already).
+        """
+        index %= self._n_songs
+        if self._prefetch is not None:
+            if self._prefetch[0] == index:
+                return
+            # Stale prefetch for another song: don't let it hold up the worker
+            self._prefetch[1].cancel()
+        future = self._prefetch_pool.submit(self._load_song_events, self.playlist[index])
+        self._prefetch = (index, future)
+
+        if self.debug:
+            print(f"[MidiSongMode] Prefetching index={index} song={self.playlist[index].name}")
+
+    def _take_song_events(self, index: int) -> List[MidiNoteEvent]:
+        """
+        Events for playlist[index]: the prefetched result if it is for this
+        song (waiting for it if the worker is still parsing), otherwise
+        parsed right here (a prefetch for another song is cancelled).
+        """
+        prefetch, self._prefetch = self._prefetch, None
+        if prefetch is not None:
+            prefetch_index, future = prefetch
+            if prefetch_index == index and not future.cancelled():
+                # Waiting is never slower than parsing the same file again
+                return future.result()
+            future.cancel()
+        return self._load_song_events(self.playlist[index])
+
+    def close(self) -> None:
+        """
+        Stop background prefetching (called on shutdown).
+        """
+        if self._prefetch is not None:
+            self._prefetch[1].cancel()
+            self._prefetch = None
+        self._prefetch_pool.shutdown(wait=False, cancel_futures=True)
+
     def _start_next_song(self, now: float) -> None:
         """
         Convenience: jump to next song in playlist order.
@@ -319,31 +471,49 @@ class MidiSongMode:
             self._start_song_by_index(self._song_index, now)
 
         t = now - self.start_time
-        eps = 0.002  # small tolerance
-
-        # 1) trigger NOTE_ON
-        while self.next_on_index < len(self.events):
-            ev = self.events[self.next_on_index]
-            if ev.start_time <= t + eps:
-                self._trigger_note_on(ev, t)
-                self.next_on_index += 1
-            else:
-                break
-
-        # 2) trigger NOTE_OFF
-        while self.next_off_index < len(self.events):
-            ev = self.events[self.next_off_index]
-            if ev.end_time <= t + eps:
-                self._trigger_note_off(ev, t)
-                self.next_off_index += 1
-            else:
-                break
+        eps_ms = 2  # small tolerance
+
+        notes = self._notes
+        keys = self._keys
+        ends = self._ends
+        n_events = len(notes)
+        t_due = int(t * 1000) + eps_ms
+
+        # 1) trigger NOTE_ON: binary-search how far the start times are due
+        i0 = self.next_on_index
+        i1 = bisect_right(self._starts, t_due, lo=i0)
+        pending_ons: List[tuple[int, int]] = []
+        if i1 > i0:
+            trigger_on = self._trigger_note_on
+            vels = self._vels
+            strengths = self._strengths
+            for i in range(i0, i1):
+                pending_ons.append(
+                    trigger_on(notes[i], keys[i], vels[i], strengths[i], ends[i], t)
+                )
+            self.next_on_index = i1
+
+        # 2) trigger NOTE_OFF: same, over the events in end-time order
+        j0 = self.next_off_index
+        j1 = bisect_right(self._off_times, t_due, lo=j0)
+        pending_offs: List[int] = []
+        if j1 > j0:
+            trigger_off = self._trigger_note_off
+            off_order = self._off_order
+            for j in range(j0, j1):
+                k = off_order[j]
+                pending_offs.append(trigger_off(notes[k], keys[k], ends[k], t))
+            self.next_off_index = j1
+
+        # Send this frame's notes to the synth as one batch each
+        if self.audio is not None and (pending_ons or pending_offs):
+            self._send_audio(pending_ons, pending_offs)
 
         # 3) update LEDs (rainbow gradient + key highlights)
         self._update_leds(t)
 
         # 4) end of song?
-        if self.next_off_index >= len(self.events) and not self.active_led_notes:
+        if self.next_off_index >= n_events and max(self._active_end) < 0:
             if self.loop_playlist:
                 # Go to next song in playlist order (with wrap-around)
                 self._start_next_song(now)
@@ -354,104 +524,176 @@ class MidiSongMode:
     # ------------------------------------------------------------------
     # Helpers: audio + LED
     # ------------------------------------------------------------------
-    def _trigger_note_on(self, ev: MidiNoteEvent, t: float) -> None:
+    def _trigger_note_on(
+        self,
+        midi_note: int,
+        key: KeyId,
+        midi_vel: int,
+        strength: float,
+        end_ms: int,
+        t: float,
+    ) -> tuple[int, int]:
         """
-        Trigger one NOTE_ON (audio + add to active_led_notes).
+        Trigger one NOTE_ON (light the note's LED key).
+        midi_vel is the MIDI velocity byte (1~127), strength the precomputed
+        LED highlight strength.
+        Returns the (midi_note, midi_vel) pair to send to the audio engine.
         """
-        key = self._midi_note_to_key(ev.midi_note)
-
-        self.active_led_notes[key] = ActiveLedNote(
-            key=key,
-            velocity=ev.velocity,
-            end_time=ev.end_time,
-        )
-
-        if self.audio is not None:
-            try:
-                self.audio.note_on_midi(ev.midi_note, ev.velocity)
-            except Exception as e:
-                if self.debug:
-                    print("[MidiSongMode] audio note_on_midi error:", e)
+        self._active_end[key] = end_ms
+        self._active_strength[key] = strength
 
         if self.debug:
             song = self.current_song.name if self.current_song else "?"
             print(
                 f"[MidiSongMode] NOTE_ON t={t:.3f}s song={song} "
-                f"midi={ev.midi_note} -> key={int(key)}, vel={ev.velocity:.2f}"
+                f"midi={midi_note} -> key={int(key)}, vel={midi_vel}"
             )
+        return midi_note, midi_vel
 
-    def _trigger_note_off(self, ev: MidiNoteEvent, t: float) -> None:
+    def _trigger_note_off(self, midi_note: int, key: KeyId, end_ms: int, t: float) -> int:
         """
-        Trigger NOTE_OFF (audio only; LED is handled by _update_leds).
+        Trigger NOTE_OFF (release the note's LED key).
+        Returns the MIDI note to send to the audio engine.
         """
-        if self.audio is not None:
-            try:
-                self.audio.note_off_midi(ev.midi_note)
-            except Exception as e:
-                if self.debug:
-                    print("[MidiSongMode] audio note_off_midi error:", e)
+        # The key may since have been taken over by a newer note; only
+        # release it if it is still showing this one.
+        if self._active_end[key] == end_ms:
+            self._active_end[key] = -1
+            self._active_strength[key] = 0.0
 
         if self.debug:
-            print(f"[MidiSongMode] NOTE_OFF t={t:.3f}s midi={ev.midi_note}")
+            print(f"[MidiSongMode] NOTE_OFF t={t:.3f}s midi={midi_note}")
+        return midi_note
+
+    def _clear_active_keys(self) -> None:
+        for key_id in range(_NUM_KEYS):
+            self._active_end[key_id] = -1
+            self._active_strength[key_id] = 0.0
+
+    def _send_audio(self, ons: List[tuple[int, int]], offs: List[int]) -> None:
+        """
+        Send one frame's NOTE_ONs (MIDI velocity bytes) and NOTE_OFFs to the
+        audio engine.
+        """
+        try:
+            if ons:
+                self.audio.notes_on_midi_raw(ons)
+            if offs:
+                self.audio.notes_off_midi(offs)
+        except Exception as e:
+            self._audio_failures += 1
+            if self.debug:
+                print("[MidiSongMode] audio batch error:", e)
+            if self._audio_failures >= _MAX_AUDIO_FAILURES:
+                print(
+                    f"[MidiSongMode] audio failed {self._audio_failures} times in a row, "
+                    "disabling song audio"
+                )
+                self.audio = None
+            return
+        self._audio_failures = 0
 
     def _update_leds(self, t: float) -> None:
         """
-        Draw LEDs based on active_led_notes, with a full-panel rainbow gradient.
+        Draw LEDs based on the active key strengths, with a full-panel rainbow gradient.
 
         - Rainbow hue slowly scrolls over time and across x.
         - Columns belonging to keys that are currently active are brighter.
         - Borders / non-key columns are dimmer background.
         """
-        # Remove expired LED notes
-        to_remove: List[KeyId] = []
-        for key, active in self.active_led_notes.items():
-            if t >= active.end_time:
-                to_remove.append(key)
-        for key in to_remove:
-            self.active_led_notes.pop(key, None)
+        led = self.led
+        width = led.width
+        column_color = self._column_color
+
+        # Snapshot of the strength per key id (kept as _last_strength below)
+        active_strength: List[float] = self._active_strength[:]
+
+        hue_step = int(t * self.rainbow_time_speed * 256)
+        if hue_step == self._last_hue_step:
+            # Rainbow hasn't moved: repaint only the key columns whose
+            # highlight changed (keeping the hue the frame was drawn with).
+            last = self._last_strength
+            if active_strength == last:
+                return
+            hue_base = self._last_hue_base
+            set_column = led.set_column
+            column_pixels = self._column_pixels
+            key_columns = self._key_columns
+            for key_id in range(_NUM_KEYS):
+                if last[key_id] == active_strength[key_id]:
+                    continue
+                for x in key_columns[key_id]:
+                    set_column(x, column_pixels(column_color(x, hue_base, active_strength)))
+            self._last_strength = active_strength
+            led.show()
+            return
 
-        width = self.led.width
-        height = self.led.height
+        # Rainbow gradient: one color per column
+        hue_base = self.rainbow_time_speed * t
+        col_colors = [column_color(x, hue_base, active_strength) for x in range(width)]
+        self._last_hue_step = hue_step
+        self._last_hue_base = hue_base
+        self._last_strength = active_strength
+
+        # Fill the reused row-major frame buffer row by row, then push it to
+        # the matrix in one blit.
+        frame = self._frame
+        row_start = 0
+        for bump in self._y_bump:
+            frame[row_start:row_start + width] = [
+                (
+                    min(255, (r * bump) >> 8),
+                    min(255, (g * bump) >> 8),
+                    min(255, (b * bump) >> 8),
+                )
+                for r, g, b in col_colors
+            ]
+            row_start += width
 
-        self.led.clear_all()
+        led.blit(frame)
+        led.show()
 
-        # strength: 0.0~1.0 based on velocity, clamped
-        active_strength: Dict[KeyId, float] = {}
-        for key, active in self.active_led_notes.items():
-            strength = max(0.2, min(1.0, active.velocity))
-            active_strength[key] = strength
-
-        # Draw rainbow gradient column by column
-        for x in range(width):
-            key_for_col = self._x_to_key.get(x)
-
-            h = (
-                self.rainbow_time_speed * t
-                + self.rainbow_spatial_span * (x / max(1, width - 1))
-            ) % 1.0
-
-            if key_for_col is not None and key_for_col in active_strength:
-                s = 1.0
-                v = 0.45 + 0.45 * active_strength[key_for_col]  # 0.45~0.9
-            elif key_for_col is not None:
-                s = 1.0
-                v = 0.18
+    def _column_color(
+        self, x: int, hue_base: float, active_strength: List[float]
+    ) -> tuple[int, int, int]:
+        """
+        Rainbow color of column x (before the vertical bump).
+        """
+        key_for_col = self._x_to_key[x]
+
+        h = (
+            hue_base
+            + self.rainbow_spatial_span * (x / max(1, self.led.width - 1))
+        ) % 1.0
+
+        # Value on a 0~255 scale
+        if key_for_col >= 0:
+            lut = self._hue_lut
+            strength = active_strength[key_for_col]
+            if strength > 0.0:
+                v = 115 + int(115 * strength)  # 0.45~0.9
             else:
-                s = 0.9
-                v = 0.08
-
-            r, g, b = self._hsv_to_rgb(h, s, v)
-
-            for y in range(height):
-                y_norm = (y / max(1, height - 1))
-                bump = 1.0 + 0.15 * math.cos((y_norm - 0.5) * math.pi)
-                rr = int(max(0, min(255, r * bump)))
-                gg = int(max(0, min(255, g * bump)))
-                bb = int(max(0, min(255, b * bump)))
+                v = 46                         # 0.18
+        else:
+            lut = self._hue_lut_border
+            v = 20                             # 0.08
 
-                self.led.set_xy(x, y, (rr, gg, bb))
+        r, g, b = lut[int(h * 256) & 255]
+        return ((r * v + 127) // 255, (g * v + 127) // 255, (b * v + 127) // 255)
 
-        self.led.show()
+    def _column_pixels(self, rgb: tuple[int, int, int]) -> List[tuple[int, int, int]]:
+        """
+        One column's pixels (y = 0..height-1) with the vertical bump applied.
+        """
+        r, g, b = rgb
+        return [
+            (
+                min(255, (r * bump) >> 8),
+                min(255, (g * bump) >> 8),
+                min(255, (b * bump) >> 8),
+            )
+            for bump in self._y_bump
+        ]
 
     def skip_to_next(self, now: float) -> None:
         """
@@ -1,7 +1,7 @@
 # src/logic/modes/piano_mode.py
 import random
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import Callable, Dict, List
 
 from src.hardware.led.led_matrix import LedMatrix
 from src.hardware.config.keys import KeyId, ALL_KEYS, make_rainbow_palette
@@ -40,6 +40,16 @@ class PianoMode:
         self.notes: Dict[KeyId, NoteState] = {
             k: NoteState(key=k, is_on=False, velocity=1.0) for k in ALL_KEYS
         }
+        # States of the keys that are currently ON (what update() draws)
+        self._on_keys: Dict[KeyId, NoteState] = {}
+        # True when the LEDs no longer match the key states / palette
+        self._dirty: bool = True
+
+        # Event type → handler (other event types are ignored)
+        self._event_handlers: Dict[EventType, Callable[[InputEvent], None]] = {
+            EventType.NOTE_ON: self._on_note_on_event,
+            EventType.NOTE_OFF: self._on_note_off_event,
+        }
 
     # ---- high-level API for notes ----
 
@@ -57,12 +67,16 @@ class PianoMode:
         # → Only update velocity (so LED brightness can change)
         # → But do NOT call audio.note_on again to avoid retriggering sound
         if state.is_on:
-            state.velocity = v
+            if state.velocity != v:
+                state.velocity = v
+                self._dirty = True
             return
 
         # First time OFF → ON
         state.is_on = True
         state.velocity = v
+        self._on_keys[key] = state
+        self._dirty = True
 
         # Trigger piano sound only once when key is pressed
         if self.audio is not None:
@@ -75,6 +89,8 @@ class PianoMode:
         if key not in self.notes:
             return
         self.notes[key].is_on = False
+        if self._on_keys.pop(key, None) is not None:
+            self._dirty = True
         if self.audio is not None:
             self.audio.note_off(key)
 
@@ -82,31 +98,51 @@ class PianoMode:
         """
         Consume NOTE_ON / NOTE_OFF events from the input layer.
         """
+        handlers = self._event_handlers
         for ev in events:
-            if DEBUG_PIANO_EVENTS and ev.type in (EventType.NOTE_ON, EventType.NOTE_OFF):
+            handler = handlers.get(ev.type)
+            if handler is None:
+                continue
+
+            if DEBUG_PIANO_EVENTS:
                 print(
                     f"[Piano] EVENT {ev.type.name} "
                     f"key={ev.key} vel={ev.velocity} src={ev.source}"
                 )
 
-            if ev.type == EventType.NOTE_ON:
-                self.note_on(ev.key, ev.velocity)
-            elif ev.type == EventType.NOTE_OFF:
-                self.note_off(ev.key)
+            handler(ev)
+
+    def _on_note_on_event(self, ev: InputEvent) -> None:
+        self.note_on(ev.key, ev.velocity)
+
+    def _on_note_off_event(self, ev: InputEvent) -> None:
+        self.note_off(ev.key)
 
     # ---- rendering ----
 
+    def reset(self, now: float) -> None:
+        """
+        Called when entering piano mode: force a full redraw on the next update.
+        """
+        self._dirty = True
+
     def update(self, now: float) -> None:
         """
         Render the current frame: light up all keys that are ON with their velocity.
+        Does nothing if no key state changed since the last frame.
         """
-        self.led.clear_all()
+        if not self._dirty:
+            return
+        self._dirty = False
+
+        led = self.led
+        fill_key = led.fill_key
+        led.clear_all()
 
-        for key, state in self.notes.items():
-            if state.is_on:
-                self.led.fill_key(key, brightness=state.velocity)
+        for state in self._on_keys.values():
+            fill_key(state.key, brightness=state.velocity)
 
-        self.led.show()
+        led.show()
 
     def randomize_palette(self) -> None:
         """
@@ -115,3 +151,4 @@ class PianoMode:
         hue_offset = random.random()        # 0.0 ~ 1.0 random starting hue
         palette = make_rainbow_palette(hue_offset=hue_offset)
         self.led.set_key_palette(palette)
+        self._dirty = True
@@ -4,18 +4,28 @@ Background audio scheduler for RhythmMode.
 
 AudioScheduler runs in a separate thread and plays ChartNote.midi_note
 at the correct time, independent from LED frame rate.
+
+When the audio engine supports it, the notes are handed to FluidSynth's
+own sequencer up front and played from the audio thread (sample accurate,
+no GIL contention with the LED loop); otherwise the thread schedules them.
 """
 
 from __future__ import annotations
 
 import threading
 import time
+from bisect import bisect_right
 from typing import List, Optional
 
 from src.hardware.audio.audio_engine import AudioEngine
 from src.logic.modes.rhythm_chart import ChartNote
 
 
+# After the last note's time, keep the sequencer alive this much longer so
+# its final events are dispatched before it is deleted.
+_SEQUENCER_TAIL_SEC = 0.25
+
+
 class AudioScheduler(threading.Thread):
     """
     Simple time-based scheduler in a background thread.
@@ -36,15 +46,29 @@ class AudioScheduler(threading.Thread):
         audio: Optional[AudioEngine],
         notes: List[ChartNote],
         time_fn=time.monotonic,
+        use_sequencer: bool = True,
     ) -> None:
         super().__init__(daemon=True)
         self.audio = audio
         self.notes = notes
         self.time_fn = time_fn
+        # Try FluidSynth's sequencer first (falls back to this thread)
+        self.use_sequencer = use_sequencer
+
+        # What run() needs from each note, precomputed once: times (sorted,
+        # for bisecting a whole chord at a time), MIDI notes and velocities
+        # as MIDI bytes (velocity clamped to 0.1~1.0, i.e. 12~127).
+        self._times: List[float] = [n.time for n in notes]
+        self._midis: List[int] = [n.midi_note for n in notes]
+        self._vels: List[int] = [
+            int(max(0.1, min(1.0, n.velocity)) * 127) for n in notes
+        ]
 
         self.start_time: float | None = None
         self.idx: int = 0
         self._stop_flag = threading.Event()
+        # Set once start_time is known (or on stop, to release run())
+        self._start_event = threading.Event()
 
     # ------------------------------------------------------------------
     # Lifecycle control
@@ -59,6 +83,7 @@ class AudioScheduler(threading.Thread):
         matches the same reference used for LED animation.
         """
         self.start_time = start_time
+        self._start_event.set()
 
     def stop(self) -> None:
         """
@@ -67,6 +92,7 @@ class AudioScheduler(threading.Thread):
         After calling stop(), you may optionally join() the thread.
         """
         self._stop_flag.set()
+        self._start_event.set()
 
     # ------------------------------------------------------------------
     # Thread main loop
@@ -82,29 +108,15 @@ class AudioScheduler(threading.Thread):
             return
 
         # Wait until start_time is set or stop is requested
-        while not self._stop_flag.is_set() and self.start_time is None:
-            time.sleep(0.001)
+        self._start_event.wait()
 
-        # Main scheduling loop
-        while (
-            not self._stop_flag.is_set()
+        if not (
+            self.use_sequencer
+            and not self._stop_flag.is_set()
             and self.start_time is not None
-            and self.idx < len(self.notes)
+            and self._run_on_sequencer()
         ):
-            now = self.time_fn()
-            song_time = now - self.start_time
-            note = self.notes[self.idx]
-
-            wait = note.time - song_time
-            if wait > 0:
-                # Sleep a bit to avoid busy looping
-                time.sleep(min(wait, 0.01))
-                continue
-
-            # Time reached → play the melody note
-            vel = int(max(0.1, min(1.0, note.velocity)) * 127)
-            self.audio.note_on_midi(note.midi_note, vel)
-            self.idx += 1
+            self._run_in_thread()
 
         # Important behavior:
         # - If all notes finish naturally (stop flag not set), do not call stop_all(),
@@ -116,3 +128,70 @@ class AudioScheduler(threading.Thread):
             except Exception:
                 # Best-effort cleanup; ignore errors on shutdown.
                 pass
+
+    def _run_on_sequencer(self) -> bool:
+        """
+        Queue every remaining note on a FluidSynth sequencer, then wait until
+        the last one has played (or stop() is called). Deleting the sequencer
+        drops anything still queued.
+
+        Returns False (nothing queued) if the audio engine has no sequencer.
+        """
+        create = getattr(self.audio, "create_sequencer", None)
+        created = create() if create is not None else None
+        if created is None:
+            return False
+        seq, dest = created
+
+        times = self._times
+        try:
+            # Song time 0 in sequencer ticks (ms)
+            base_tick = seq.get_tick() + (self.start_time - self.time_fn()) * 1000.0
+            schedule = self.audio.schedule_note_on_midi
+            midis = self._midis
+            vels = self._vels
+            for i in range(self.idx, len(times)):
+                tick = max(0, int(base_tick + times[i] * 1000.0))
+                schedule(seq, dest, tick, midis[i], vels[i])
+
+            end_time = (times[-1] if times else 0.0) + _SEQUENCER_TAIL_SEC
+            while True:
+                remaining = end_time - (self.time_fn() - self.start_time)
+                if remaining <= 0 or self._stop_flag.wait(timeout=min(remaining, 0.05)):
+                    break
+            if not self._stop_flag.is_set():
+                self.idx = len(times)
+        finally:
+            seq.delete()
+        return True
+
+    def _run_in_thread(self) -> None:
+        """
+        Fallback: play each note from this thread when its time comes.
+        """
+        times = self._times
+        midis = self._midis
+        vels = self._vels
+        n_notes = len(times)
+        notes_on_midi_raw = self.audio.notes_on_midi_raw
+        while (
+            not self._stop_flag.is_set()
+            and self.start_time is not None
+            and self.idx < n_notes
+        ):
+            now = self.time_fn()
+            song_time = now - self.start_time
+            idx = self.idx
+
+            # All notes due by now (a whole chord shares one time)
+            due = bisect_right(times, song_time, lo=idx)
+            if due == idx:
+                # Sleep until the next note is due; stop() wakes us immediately.
+                # Capped so a time_fn that isn't wall-clock is re-read regularly.
+                if self._stop_flag.wait(timeout=min(times[idx] - song_time, 0.05)):
+                    break
+                continue
+
+            # Time reached → play the melody notes (velocities are MIDI bytes)
+            notes_on_midi_raw([(midis[i], vels[i]) for i in range(idx, due)])
+            self.idx = due
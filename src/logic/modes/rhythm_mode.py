@@ -4,10 +4,16 @@ from __future__ import annotations
 
 import math
 import time
-from typing import List, Optional, Dict, Tuple
+from bisect import bisect_left, bisect_right
+from typing import Callable, List, Optional, Dict, Tuple
 
 import mido
 
+try:
+    import symusic  # optional C++ MIDI parser, much faster than mido
+except ImportError:
+    symusic = None
+
 from src.hardware.led.led_matrix import LedMatrix
 from src.hardware.config.keys import KeyId
 from src.logic.input_event import InputEvent, EventType
@@ -63,6 +69,17 @@ FEEDBACK_DURATION_SEC = 0.25
 LEAD_IN_SEC = 1.0
 TAIL_HOLD_SEC = 4.0
 
+# Integer mirror of RhythmMode.phase for cheap per-frame checks
+PHASE_WAIT_COUNTDOWN = 0
+PHASE_PLAY = 1
+PHASE_DONE = 2
+
+PHASE_IDS: Dict[str, int] = {
+    "WAIT_COUNTDOWN": PHASE_WAIT_COUNTDOWN,
+    "PLAY": PHASE_PLAY,
+    "DONE": PHASE_DONE,
+}
+
 
 class RhythmMode:
     """
@@ -93,9 +110,14 @@ class RhythmMode:
         self.midi_path: str = self.midi_paths[self.difficulty]
 
         self.phase: str = "WAIT_COUNTDOWN"  # "WAIT_COUNTDOWN" / "PLAY" / "DONE"
+        self.phase_id: int = PHASE_WAIT_COUNTDOWN  # always PHASE_IDS[self.phase]
         self.play_start: float | None = None
 
         self.chart_notes: List[ChartNote] = []
+        # Per-lane view of chart_notes (same objects, time order) plus their
+        # times, so a key press only looks at notes inside its hit window.
+        self._lane_notes: Dict[KeyId, List[ChartNote]] = {}
+        self._lane_times: Dict[KeyId, List[float]] = {}
         self._notes_built: bool = False
         self._miss_index: int = 0
 
@@ -105,6 +127,14 @@ class RhythmMode:
 
         self._key_x_ranges = self._build_key_x_ranges()
 
+        # Row-major frame buffer (frame[y * width + x]) for PLAY rendering,
+        # pushed with one led.blit per frame instead of per-pixel set_xy.
+        n_pixels = self.led.width * self.led.height
+        self._blank_frame: List[Tuple[int, int, int]] = [(0, 0, 0)] * n_pixels
+        self._frame: List[Tuple[int, int, int]] = list(self._blank_frame)
+        # The WAIT_COUNTDOWN screen never changes, so it is built once.
+        self._countdown_frame = self._build_countdown_frame()
+
         self.feedback_until_song_time: float | None = None
         self.feedback_color: Optional[Tuple[int, int, int]] = None
 
@@ -112,6 +142,10 @@ class RhythmMode:
 
         self.audio_scheduler: Optional[AudioScheduler] = None
 
+        # Called once when a finished run enters DONE (InputManager uses it
+        # to arm the post-game timeline instead of polling phase every frame).
+        self.on_done: Optional[Callable[[], None]] = None
+
     # ------------------------------------------------------------------
     # External hooks for InputManager
     # ------------------------------------------------------------------
@@ -135,7 +169,7 @@ class RhythmMode:
         if self.debug:
             print("[Rhythm] on_exit() → stop_audio + phase=DONE")
         self.stop_audio()
-        self.phase = "DONE"
+        self._set_phase("DONE")
         # Leaving rhythm mode: it's OK to hard clear once
         self.led.clear_all()
         self.led.show()
@@ -143,7 +177,7 @@ class RhythmMode:
     def reset(self, now: float) -> None:
         self.stop_audio()
 
-        self.phase = "WAIT_COUNTDOWN"
+        self._set_phase("WAIT_COUNTDOWN")
         self.play_start = None
         self.score = 0
 
@@ -179,7 +213,7 @@ class RhythmMode:
                 print(f"[Rhythm] start_play_after_countdown() ignored, phase={self.phase}")
             return
 
-        self.phase = "PLAY"
+        self._set_phase("PLAY")
         self.play_start = now + LEAD_IN_SEC
         self.render_start_index = 0
         self.feedback_color = None
@@ -229,6 +263,10 @@ class RhythmMode:
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
+    def _set_phase(self, phase: str) -> None:
+        self.phase = phase
+        self.phase_id = PHASE_IDS[phase]
+
     def _reset_notes_state(self) -> None:
         for n in self.chart_notes:
             n.hit = False
@@ -259,12 +297,84 @@ class RhythmMode:
         return self._key_x_ranges.get(key, (1, max(1, self.led.width - 1)))
 
     def _build_chart_from_midi(self) -> None:
-        try:
-            mid = mido.MidiFile(self.midi_path)
-        except Exception as e:
-            print(f"[Rhythm] Failed to load MIDI: {self.midi_path} ({e})")
-            self.chart_notes = []
-            return
+        raw_notes: Optional[List[ChartNote]] = None
+        if symusic is not None:
+            try:
+                raw_notes = self._read_raw_notes_symusic()
+            except Exception as e:
+                if self.debug:
+                    print(f"[Rhythm] symusic failed on {self.midi_path} ({e}), using mido")
+
+        if raw_notes is None:
+            try:
+                raw_notes = self._read_raw_notes_mido()
+            except Exception as e:
+                print(f"[Rhythm] Failed to load MIDI: {self.midi_path} ({e})")
+                self.chart_notes = []
+                self._build_lane_index()
+                return
+
+        raw_notes.sort(key=lambda n: n.time)
+
+        # Notes closer than cluster_eps to the previous one form a cluster
+        # (a chord); keep only its highest note. The running best is tracked
+        # while streaming instead of collecting each cluster into a list.
+        melody: List[ChartNote] = []
+        cluster_eps = 0.08
+        best: Optional[ChartNote] = None
+        prev_time = 0.0
+
+        for note in raw_notes:
+            if best is not None and abs(note.time - prev_time) <= cluster_eps:
+                if note.midi_note > best.midi_note:
+                    best = note
+            else:
+                if best is not None:
+                    melody.append(best)
+                best = note
+            prev_time = note.time
+
+        if best is not None:
+            melody.append(best)
+
+        self.chart_notes = melody
+        self._build_lane_index()
+
+        if self.debug:
+            print(
+                f"[Rhythm] MIDI parsed ({self.difficulty}): "
+                f"raw={len(raw_notes)} → melody={len(melody)}"
+            )
+
+    def _read_raw_notes_symusic(self) -> List[ChartNote]:
+        """
+        Every non-drum note-on of the MIDI file (unsorted), parsed by symusic
+        with times already in seconds.
+        """
+        score = symusic.Score.from_file(self.midi_path).to("second")
+
+        raw_notes: List[ChartNote] = []
+        for track in score.tracks:
+            if track.is_drum:
+                continue
+            for note in track.notes:
+                if note.velocity <= 0:
+                    continue
+                raw_notes.append(
+                    ChartNote(
+                        time=float(note.time),
+                        midi_note=note.pitch,
+                        key=self._midi_note_to_key(note.pitch),
+                        velocity=note.velocity / 127.0,
+                    )
+                )
+        return raw_notes
+
+    def _read_raw_notes_mido(self) -> List[ChartNote]:
+        """
+        Every non-drum note-on of the MIDI file, in playback order (mido).
+        """
+        mid = mido.MidiFile(self.midi_path)
 
         ticks_per_beat = mid.ticks_per_beat
         tempo = 500000
@@ -295,31 +405,14 @@ class RhythmMode:
                     ChartNote(time=time_sec, midi_note=midi_note, key=key, velocity=velocity)
                 )
 
-        raw_notes.sort(key=lambda n: n.time)
-
-        melody: List[ChartNote] = []
-        if raw_notes:
-            cluster: List[ChartNote] = [raw_notes[0]]
-            cluster_eps = 0.08
-
-            for note in raw_notes[1:]:
-                if abs(note.time - cluster[-1].time) <= cluster_eps:
-                    cluster.append(note)
-                else:
-                    best = max(cluster, key=lambda n: n.midi_note)
-                    melody.append(best)
-                    cluster = [note]
+        return raw_notes
 
-            best = max(cluster, key=lambda n: n.midi_note)
-            melody.append(best)
-
-        self.chart_notes = melody
-
-        if self.debug:
-            print(
-                f"[Rhythm] MIDI parsed ({self.difficulty}): "
-                f"raw={len(raw_notes)} → melody={len(melody)}"
-            )
+    def _build_lane_index(self) -> None:
+        lane_notes: Dict[KeyId, List[ChartNote]] = {k: [] for k in RHYTHM_KEYS}
+        for note in self.chart_notes:
+            lane_notes.setdefault(note.key, []).append(note)
+        self._lane_notes = lane_notes
+        self._lane_times = {k: [n.time for n in notes] for k, notes in lane_notes.items()}
 
     def _midi_note_to_key(self, midi_note: int) -> KeyId:
         idx = (midi_note - 60) % 5
@@ -398,14 +491,22 @@ class RhythmMode:
                 continue
 
             lane_key = ev.key
+            lane_notes = self._lane_notes.get(lane_key)
+            if not lane_notes:
+                continue
 
             best_note: Optional[ChartNote] = None
             best_adt: float | None = None
             best_dt: float = 0.0
 
-            for note in self.chart_notes:
-                if note.key != lane_key:
-                    continue
+            # Only this lane's notes within +-MISS_LATE_SEC can be hit
+            # (the window is widened a hair so float rounding at the edge
+            # is left to the exact adt check below).
+            lane_times = self._lane_times[lane_key]
+            lo = bisect_left(lane_times, song_time - MISS_LATE_SEC - 1e-6)
+            hi = bisect_right(lane_times, song_time + MISS_LATE_SEC + 1e-6, lo=lo)
+
+            for note in lane_notes[lo:hi]:
                 if note.judged:
                     continue
 
@@ -448,16 +549,19 @@ class RhythmMode:
     # ------------------------------------------------------------------
     # WAIT_COUNTDOWN rendering
     # ------------------------------------------------------------------
-    def _render_wait_countdown(self) -> None:
-        self.led.clear_all()
-        h = self.led.height
+    def _build_countdown_frame(self) -> List[Tuple[int, int, int]]:
+        w = self.led.width
+        frame = list(self._blank_frame)
 
         for key, color in DIFFICULTY_SELECTION_COLORS.items():
             x0, x1 = self._key_x_range(key)
-            for x in range(x0, x1):
-                for y in range(h):
-                    self.led.set_xy(x, y, color)
+            for row in range(0, len(frame), w):
+                frame[row + x0:row + x1] = [color] * (x1 - x0)
 
+        return frame
+
+    def _render_wait_countdown(self) -> None:
+        self.led.blit(self._countdown_frame)
         self.led.show()
 
     # ------------------------------------------------------------------
@@ -483,10 +587,13 @@ class RhythmMode:
             return
 
         # Enter DONE: clear LEDs ONCE
-        self.phase = "DONE"
+        self._set_phase("DONE")
         self.led.clear_all()
         self.led.show()
 
+        if self.on_done is not None:
+            self.on_done()
+
         if self.debug:
             print(
                 f"[Rhythm] DONE. score={self.score}/{self.max_score} "
@@ -530,27 +637,35 @@ class RhythmMode:
         return (r, g, b)
 
     def _render_play(self, song_time: float) -> None:
-        self.led.clear_all()
+        led = self.led
+        frame = self._frame
+        frame[:] = self._blank_frame
 
-        w = self.led.width
-        h = self.led.height
+        w = led.width
+        h = led.height
+        y_span = h - 1
+
+        compute_progress = self._compute_fall_progress
+        compute_color = self._compute_note_color
+        key_x_range = self._key_x_range
 
         for note in self.chart_notes[self.render_start_index:]:
-            progress = self._compute_fall_progress(note, song_time)
+            progress = compute_progress(note, song_time)
             if progress is None:
                 if note.time - song_time > FALL_DURATION_SEC:
                     break
                 continue
 
-            y_center = int((1.0 - progress) * (h - 1) + 0.5)
+            y_center = int((1.0 - progress) * y_span + 0.5)
 
-            color = self._compute_note_color(note, progress, song_time)
-            x0, x1 = self._key_x_range(note.key)
+            color = compute_color(note, progress, song_time)
+            x0, x1 = key_x_range(note.key)
 
-            for x in range(x0, x1):
-                for y in range(y_center - 1, y_center + 2):
-                    if 0 <= y < h:
-                        self.led.set_xy(x, y, color)
+            # 3-pixel-tall block, clipped to the panel once per note
+            block_row = [color] * (x1 - x0)
+            for y in range(max(0, y_center - 1), min(h, y_center + 2)):
+                row = y * w
+                frame[row + x0:row + x1] = block_row
 
         if (
             self.feedback_color is not None
@@ -558,10 +673,10 @@ class RhythmMode:
             and self.play_start is not None
         ):
             if song_time <= self.feedback_until_song_time:
-                left_x = 0
-                right_x = w - 1
-                for y in range(h):
-                    self.led.set_xy(left_x, y, self.feedback_color)
-                    self.led.set_xy(right_x, y, self.feedback_color)
+                feedback_color = self.feedback_color
+                for row in range(0, w * h, w):
+                    frame[row] = feedback_color           # left column
+                    frame[row + w - 1] = feedback_color   # right column
 
-        self.led.show()
+        led.blit(frame)
+        led.show()